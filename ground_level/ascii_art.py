@@ -1,7 +1,12 @@
 """ASCII art assets for the Ground Level of AI-LLM-Dungeon."""
 
+import os
+import sys
 import time
 
+# GAME_FAST_MODE=1 drops all pacing delays, for CI runs and replays
+_FAST_MODE = os.environ.get("GAME_FAST_MODE", "0") != "0"
+
 # Welcome banner for Ground Level
 GROUND_LEVEL_BANNER = r"""
 ╔════════════════════════════════════════════════════════════╗
@@ -15,6 +20,7 @@ GROUND_LEVEL_BANNER = r"""
 ║                                                            ║
 ╚════════════════════════════════════════════════════════════╝
 """
+_BANNER_TEXT = GROUND_LEVEL_BANNER + "\n"
 
 # Certificate awarded when player completes Ground Level
 CERTIFICATE_ART = r"""
@@ -35,6 +41,7 @@ CERTIFICATE_ART = r"""
 ║    • Model Library: https://ollama.com/library               ║
 ╚══════════════════════════════════════════════════════════════╝
 """
+_CERTIFICATE_TEXT = CERTIFICATE_ART + "\n"
 
 # Visual indicator for descending to deeper dungeon levels
 DESCEND_ART = r"""
@@ -43,6 +50,7 @@ DESCEND_ART = r"""
        deeper darkness...
      ⬇️  ⬇️  ⬇️  ⬇️  ⬇️
 """
+_DESCEND_TEXT = DESCEND_ART + "\n"
 
 # Sidekick ASCII Art
 PHI3_MINI_ART = r"""
@@ -72,6 +80,13 @@ LLAMA3_8B_ART = r"""
  (_|_||_|_)
 """
 
+# Sidekick art by sidekick name
+_SIDEKICK_ART = {
+    "Phi3 Mini": PHI3_MINI_ART,
+    "Qwen Lite": QWEN_LITE_ART,
+    "Llama3 8b": LLAMA3_8B_ART,
+}
+
 # Shaman NPC art
 SHAMAN_ART = r"""
       /\
@@ -84,6 +99,7 @@ SHAMAN_ART = r"""
     /|  |\
    (_|  |_)
 """
+_SHAMAN_TEXT = SHAMAN_ART + "\n"
 
 # Room transition
 ROOM_TRANSITION = r"""
@@ -92,6 +108,9 @@ ROOM_TRANSITION = r"""
     └─────────────────────────┘
 """
 
+# Fully rendered transition output, reused for every room change
+_ROOM_TRANSITION_TEXT = ROOM_TRANSITION + "\n"
+
 # Victory/completion screen
 VICTORY_SCREEN = r"""
 ╔═══════════════════════════════════════════════════════╗
@@ -110,6 +129,7 @@ VICTORY_SCREEN = r"""
 ║                                                       ║
 ╚═══════════════════════════════════════════════════════╝
 """
+_VICTORY_TEXT = VICTORY_SCREEN + "\n"
 
 # Tip unlock notification
 TIP_UNLOCK_TEMPLATE = r"""
@@ -124,12 +144,7 @@ LOADING_DOTS = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "
 
 def get_sidekick_art(name: str) -> str:
     """Returns ASCII art for a specific sidekick by name."""
-    art_map = {
-        "Phi3 Mini": PHI3_MINI_ART,
-        "Qwen Lite": QWEN_LITE_ART,
-        "Llama3 8b": LLAMA3_8B_ART,
-    }
-    return art_map.get(name, "")
+    return _SIDEKICK_ART.get(name, "")
 
 def display_tip_unlock(tip_text: str) -> None:
     """Displays a tip unlock notification."""
@@ -137,27 +152,55 @@ def display_tip_unlock(tip_text: str) -> None:
 
 def display_banner() -> None:
     """Displays the Ground Level welcome banner."""
-    print(GROUND_LEVEL_BANNER)
+    sys.stdout.write(_BANNER_TEXT)
 
 def display_victory() -> None:
     """Displays the victory screen."""
-    print(VICTORY_SCREEN)
+    sys.stdout.write(_VICTORY_TEXT)
 
 def display_certificate() -> None:
     """Displays the Certificate of Ollama Mastery."""
-    print(CERTIFICATE_ART)
+    sys.stdout.write(_CERTIFICATE_TEXT)
 
 def display_descend() -> None:
     """Displays the descend/transition art."""
-    print(DESCEND_ART)
+    sys.stdout.write(_DESCEND_TEXT)
 
 def display_room_transition() -> None:
     """Displays a room transition animation."""
-    print(ROOM_TRANSITION)
+    sys.stdout.write(_ROOM_TRANSITION_TEXT)
 
 def display_shaman() -> None:
     """Displays the Shaman ASCII art."""
-    print(SHAMAN_ART)
+    sys.stdout.write(_SHAMAN_TEXT)
+
+def pacing_enabled() -> bool:
+    """
+    Check whether output should be paced for a player to read.
+    
+    Pacing is only for a player watching a terminal; fast mode and piped
+    or captured output skip it.
+    
+    Returns:
+        True if stdout is a terminal and fast mode is off
+    """
+    return not _FAST_MODE and sys.stdout.isatty()
+
+def pause(delay: float) -> None:
+    """
+    Flush pending output, then wait.
+    
+    The game loop block-buffers stdout, so paced text must be flushed
+    before sleeping or it would only appear after the pause. In fast
+    mode nothing waits, so the output is left to the next flush.
+    
+    Args:
+        delay: Delay in seconds
+    """
+    if _FAST_MODE:
+        return
+    sys.stdout.flush()
+    time.sleep(delay)
 
 def slow_print(text: str, delay: float = 0.3) -> None:
     """
@@ -167,8 +210,13 @@ def slow_print(text: str, delay: float = 0.3) -> None:
         text: The text to print (can contain newlines)
         delay: Delay in seconds between lines (default: 0.3)
     """
+    # Unpaced output gets the whole text in a single write
+    if not pacing_enabled():
+        sys.stdout.write(text + "\n")
+        return
+    
     lines = text.split('\n')
     for line in lines:
         print(line)
         if line.strip():  # Only add delay after non-empty lines
-            time.sleep(delay)
+            pause(delay)
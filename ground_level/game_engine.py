@@ -2,25 +2,236 @@
 
 import json
 import os
-import time
-from typing import Dict, Optional, List
+import re
+from functools import partial
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, Optional, List, Tuple
 from .player import Player
 from .sidekick import Sidekick
 from .puzzle import Puzzle
 from .room import Room, create_room
 from .ollama_simulator import OllamaSimulator
-from .ascii_art import display_banner, display_victory, display_room_transition, display_shaman, slow_print, display_certificate, display_descend
+from .lesson_text import INSTALL_LESSON, LESSON_DEBRIEFS
+from .ascii_art import display_banner, display_victory, display_room_transition, display_shaman, pause, slow_print, display_certificate, display_descend
 
-# Import shared navigation system
+# Make the shared game package importable; the CLI entry points have
+# usually put the repository root on the path already
 import sys
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from game.navigation import show_descend_menu
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
 from game.commands import StandardCommands
 
 # ANSI color codes for terminal output
 COLOR_CYAN = '\033[96m'
 COLOR_RESET = '\033[0m'
 
+# Horizontal rule framing the end-of-level messages
+_RULE = "=" * 60
+_RULE_LINE = "\n" + _RULE + "\n"
+
+# Closing frame for the password victory
+_DESCEND_FOOTER = (
+    f"{_RULE_LINE}"
+    "Type 'descend' to proceed to deeper levels, or 'quit' to exit.\n"
+    "You can also explore the dungeon by moving 'west' to revisit rooms.\n"
+    f"{_RULE}\n\n"
+)
+
+# Exploration hints shown once the Ground Level is beaten
+_POST_VICTORY_LINES = (
+    "🌟 POST-VICTORY EXPLORATION ENABLED! 🌟",
+    "\nYou can now freely explore the dungeon to review your learnings!",
+    "Move between rooms using 'east' and 'west' commands.",
+    "Visit any room to revisit what you learned:",
+    "  • Room 0 (west): Ollama Village - Review basic commands",
+    "  • Room 1 (west): Summoning Chamber - Model pulling",
+    "  • Room 2 (west): Riddle Hall - Model capabilities",
+    "  • Room 3 (west): Upgrade Forge - Model management",
+    "  • Room 4: Victory Chamber (you are here)",
+    "\nType 'quit' when you're ready to exit.\n",
+)
+_POST_VICTORY_TEXT = "\n".join(_POST_VICTORY_LINES) + "\n"
+
+# The riddle victory's closing frame runs straight into the exploration hints
+_VICTORY_FOOTER = f"""
+{_RULE}
+Thank you for playing AI-LLM-Dungeon: Ground Level!
+You've learned the fundamentals of Ollama and LLM management.
+{_RULE}
+
+""" + _POST_VICTORY_TEXT
+
+# Command prefixes for near-miss attempts that earn a corrective hint
+# instead of "Unknown command"
+_PULL_PREFIX = "ollama pull"
+_SUMMON_PREFIX = "summon"
+_SUMMON_LLAMA_PREFIXES = ("summon llama", "summon the llama")
+
+# Ground Level sections of the help screen
+_HELP_LEVEL_SPECIFIC = """LEARNING:
+  learn                    - Begin or continue lessons with the Shaman
+  tips                     - View unlocked knowledge tips
+
+OLLAMA COMMANDS (as you learn them):
+  ollama                   - Base ollama command
+  ollama serve             - Start ollama server
+  ollama list              - List installed models
+  ollama pull <model>      - Download a model
+  ollama run <model>       - Run/chat with a model
+  ollama show <model>      - Show model information
+  ollama rm <model>        - Remove a model
+
+ROOM-SPECIFIC:
+  summon <model>           - Summon sidekick in Summoning Chamber
+  answer <text>            - Answer riddles in Riddle Hall
+  upgrade <sidekick>       - Upgrade sidekick in Upgrade Forge"""
+
+_HELP_TIPS = """TIPS:
+  - Follow the Shaman's teachings in Ollama Village
+  - Room-specific commands vary - follow the prompts!
+  - Use 'east' or 'west' to move between rooms when available"""
+
+# The full help screen never changes, so it is formatted once at import
+_HELP_TEXT = StandardCommands().format_help(_HELP_LEVEL_SPECIFIC, _HELP_TIPS) + "\n"
+
+# Inputs that leave a sidekick's interactive session
+_SESSION_EXIT_COMMANDS = frozenset(("/bye", "exit", "quit"))
+
+# Matches a whole word that makes a session question count as asking the
+# strawberry riddle. An apostrophe only joins letters inside a word, so quoted
+# words like 'r's and 'strawberry' still count.
+_RIDDLE_TRIGGER_RE = re.compile(
+    r"(?<![a-z])(?<![a-z]')(?:strawberry(?:'s)?|rs|r's|r)(?![a-z])(?!'[a-z])"
+)
+
+# Farewell shown when the player quits
+_QUIT_TEXT = "\n".join([
+    "\nThank you for playing AI-LLM-Dungeon!",
+    "\n💡 To continue your adventure later:",
+    "   • Run this level again: python3 ./ground_level_cli.py",
+    "   • Try other levels: python3 ./token_crypts_cli.py",
+    "   • Use 'ls' to see all available level scripts",
+    "\nYour progress has been noted. Farewell, adventurer!\n",
+]) + "\n"
+
+# Commands that complete each Ollama Village lesson, mapped to lesson number
+_ROOM0_LESSON_COMMANDS = {
+    "ollama": 1,
+    "ollama serve": 2,
+    "ollama list": 3,
+    "ollama pull phi3:mini": 4,
+    "ollama run phi3:mini": 5,
+    "ollama show phi3:mini": 6,
+    "ollama rm phi3:mini": 7,
+}
+
+# Responses shared by several room handlers
+_MSG_ALREADY_LEARNED = "\n✅ You've already learned this command! Continue with the next lesson."
+_MSG_OBJECTIVES_FIRST = "⚠️  You must complete this room's objectives first!"
+_MSG_UNKNOWN_COMMAND = "Unknown command. Type 'help' for available commands."
+_MSG_SESSION_EXIT = "Exiting interactive session.\n"
+
+# Llama3's answer once the riddle is solved, with the Victory Chamber password
+# in a cross-platform ASCII box
+_ORACLE_REVEAL_TEXT = "\n".join((
+    "The Oracle's eyes glow with approval!",
+    "\n✨ The treasure chest begins to glow with golden light! ✨",
+    "Ancient locks click open one by one...",
+    "The chest lid slowly rises, revealing a scroll inside.",
+    "\nLlama3 8b continues: 'By the way, you've earned access to the Victory Chamber.'",
+    "\nThe Oracle reveals:",
+    "╔════════════════════════════════════╗",
+    "║   PASSWORD: Ollama Apprentice     ║",
+    "╚════════════════════════════════════╝",
+    "\n>>> /bye",
+    _MSG_SESSION_EXIT,
+)) + "\n"
+
+# Full level map shown by 'map'
+_MAP_TEXT = """
+╔══════════════════════════════════════════════════════════════╗
+║                      OLLAMA VILLAGE MAP                      ║
+╚══════════════════════════════════════════════════════════════╝
+
+    [VILLAGE]───[SUMMON]───[RIDDLE]───[FORGE]───[VICTORY]
+
+  • VILLAGE     - Ollama Village (Learn Ollama basics)
+  • SUMMON      - Summoning Chamber (Summon your sidekick)
+  • RIDDLE      - Riddle Hall (Solve riddles with your sidekick)
+  • FORGE       - Upgrade Forge (Upgrade your sidekick)
+  • VICTORY     - Victory Chamber (Complete the level)
+
+"""
+
+# Position strip shown by 'pwd', indexed by room ID with the current room starred
+_PWD_LABELS = ("VILLAGE", "SUMMON", "RIDDLE", "FORGE", "VICTORY")
+_PWD_LINE = "───".join(f"[{label}]" for label in _PWD_LABELS)
+_PWD_TEXT = tuple(
+    "\n    " + _PWD_LINE.replace(f"[{label}]", f"[{label}*]") + "\n\n" for label in _PWD_LABELS
+)
+
+# Sections shown after the certificate, each followed by its pause in seconds
+_PATH_FORWARD_SCRIPT = (
+    (
+        "\n🚪 THE PATH FORWARD 🚪\n\n"
+        "Your training is complete, but your adventure has just begun!\n"
+        "The dungeon descends deeper with greater challenges awaiting...\n\n",
+        1.0,
+    ),
+    (
+        "  ⬇️  NEXT: Token Crypts\n"
+        "      Learn how LLMs see the world through tokens.\n"
+        "      Run: python3 ./token_crypts_cli.py\n\n",
+        0.8,
+    ),
+    (
+        "  🔮 COMING SOON:\n"
+        "      • Temperature Tavern - Master sampling parameters\n"
+        "      • Context Catacombs - Understand context windows\n"
+        "      • Prompt Palace - Advanced prompt engineering\n\n",
+        0.8,
+    ),
+    (
+        "💡 REAL-WORLD NEXT STEPS:\n"
+        "   1. Install Ollama: https://ollama.com/download\n"
+        "   2. Pull your first model: ollama pull llama3\n"
+        "   3. Start chatting: ollama run llama3\n"
+        "\n"
+        "📚 Learn more about Ollama:\n"
+        "   • GitHub repository: https://github.com/ollama/ollama\n"
+        "   • API docs: https://github.com/ollama/ollama/blob/main/docs/api.md\n"
+        "   • Model library: https://ollama.com/library\n\n",
+        0.5,
+    ),
+)
+
+# Gate bit set alongside Player.completed_rooms_mask once the Victory
+# Chamber password is discovered (rooms use bits 0-4)
+_PASSWORD_GATE = 1 << 5
+
+# Exits listed by 'ls', indexed by room ID: (direction, destination,
+# gate bits that must all be set to open it, or 0 if it is always open)
+_ROOM_EXITS = (
+    (("east", "Summoning Chamber", 1 << 0),),
+    (("west", "Ollama Village", 0), ("east", "Riddle Hall", 1 << 1)),
+    (("west", "Summoning Chamber", 0), ("east", "Upgrade Forge", 1 << 2)),
+    (("west", "Riddle Hall", 0), ("east", "Victory Chamber", 1 << 3 | _PASSWORD_GATE)),
+    (("west", "Upgrade Forge", 0),),
+)
+
+# Game-loop prompt for each room, indexed by room ID
+_PROMPTS = tuple(f"\n[Room {room_id}]> " for room_id in range(5))
+
+
+class _QuitGame(BaseException):
+    """
+    Raised by the quit command to leave the game loop.
+    
+    Derives from BaseException so the loop's per-command error handler
+    does not swallow it.
+    """
+
 
 class GameEngine:
     """
@@ -30,6 +241,15 @@ class GameEngine:
     and coordinating all game systems.
     """
     
+    # Fixed attribute layout: handlers read these on every turn
+    __slots__ = (
+        "data_dir", "player", "sidekicks", "puzzles", "tips",
+        "current_room", "ollama", "game_running", "standard_commands", "verbose",
+        "_phi3", "_llama3", "_riddle01", "_tip_cache", "_rooms", "_room0_lesson_actions",
+        "_room0_lesson_repeats", "_room_commands", "_room_fallbacks", "_commands",
+        "_stdin",
+    )
+    
     def __init__(self, data_dir: str = "data"):
         """
         Initialize the game engine.
@@ -39,44 +259,176 @@ class GameEngine:
         """
         self.data_dir = data_dir
         self.player = Player()
-        self.sidekicks: Dict[str, Sidekick] = {}
-        self.puzzles: Dict[str, Puzzle] = {}
-        self.tips: Dict[str, dict] = {}
+        self.sidekicks: Mapping[str, Sidekick] = {}
+        self.puzzles: Mapping[str, Puzzle] = {}
+        self.tips: Mapping[str, dict] = {}
         self.current_room: Optional[Room] = None
         self.ollama = OllamaSimulator()
         self.game_running = True
         self.standard_commands = StandardCommands()  # Standard command helper
+        self.verbose = os.environ.get("GAME_VERBOSE", "1") != "0"  # Follow-up hints
+        self._stdin = sys.stdin  # Read directly when not attached to a terminal
         
         # Load all game data
         self._load_data()
         
-        # Initialize first room (Ollama Village)
-        self.current_room = create_room(0)
+        # Build every room once, indexed by room ID, so moving between rooms
+        # is a lookup and revisits keep each room's state
+        self._rooms: Tuple[Room, ...] = tuple(create_room(room_id) for room_id in range(5))
+        
+        # Start in the first room (Ollama Village)
+        self.current_room = self._rooms[0]
+        
+        # Ollama Village practice actions indexed by lesson number (index 0,
+        # 'learn', has its own introduction). Repeats run once a lesson is learned.
+        self._room0_lesson_actions = (
+            None,
+            partial(print, "✅ Correct! The `ollama` command is your gateway to LLM management."),
+            self.ollama.serve,
+            self.ollama.list_models,
+            partial(self.ollama.pull_model, "phi3-mini"),
+            self._simulate_phi3_run,
+            partial(self.ollama.show_model, "phi3-mini"),
+            partial(self.ollama.remove_model, "phi3-mini"),
+        )
+        self._room0_lesson_repeats = (
+            None,
+            partial(print, _MSG_ALREADY_LEARNED),
+            partial(print, _MSG_ALREADY_LEARNED),
+            self.ollama.list_models,
+            partial(self.ollama.pull_model, "phi3-mini"),
+            partial(print, "\n✅ You've already learned this command!"),
+            partial(self.ollama.show_model, "phi3-mini"),
+            partial(self.ollama.remove_model, "phi3-mini"),
+        )
+        
+        # Command dispatch tables
+        self._build_dispatch()
     
     def _load_data(self) -> None:
         """Load all JSON data files."""
+        # Each parsed list is converted to domain objects as it is consumed,
+        # so the raw parse tree is released as soon as its registry is built
+        
         # Load sidekicks/models
         models_path = os.path.join(self.data_dir, "models.json")
-        with open(models_path, 'r') as f:
-            models_data = json.load(f)
-            for model_data in models_data:
-                sidekick = Sidekick.from_dict(model_data)
-                self.sidekicks[sidekick.name] = sidekick
+        self.sidekicks = MappingProxyType({
+            sidekick.name: sidekick
+            for sidekick in map(Sidekick.from_dict, self._read_json(models_path))
+        })
         
         # Load puzzles
         puzzles_path = os.path.join(self.data_dir, "puzzles.json")
-        with open(puzzles_path, 'r') as f:
-            puzzles_data = json.load(f)
-            for puzzle_data in puzzles_data:
-                puzzle = Puzzle.from_dict(puzzle_data)
-                self.puzzles[puzzle.id] = puzzle
+        self.puzzles = MappingProxyType({
+            puzzle.id: puzzle
+            for puzzle in map(Puzzle.from_dict, self._read_json(puzzles_path))
+        })
         
         # Load tips
         tips_path = os.path.join(self.data_dir, "tips.json")
-        with open(tips_path, 'r') as f:
-            tips_data = json.load(f)
-            for tip in tips_data:
-                self.tips[tip["id"]] = tip
+        self.tips = MappingProxyType({tip["id"]: tip for tip in self._read_json(tips_path)})
+        
+        # Direct references for the objects the room handlers use on every command
+        self._phi3 = self.sidekicks["Phi3 Mini"]
+        self._llama3 = self.sidekicks["Llama3 8b"]
+        self._riddle01 = self.puzzles["riddle_01"]
+        self._tip_cache: Dict[str, str] = {tip_id: tip["text"] for tip_id, tip in self.tips.items()}
+    
+    def _build_dispatch(self) -> None:
+        """
+        Build the command tables process_command looks input up in.
+        
+        The tables hold bound methods, so they are built per engine once
+        the sidekicks are loaded (their summon scrolls are commands too).
+        """
+        # Per-room command tables, indexed by room ID. Each maps an exact
+        # command to its handler; anything else falls through to the global
+        # commands and then to the room's unknown-command hints.
+        room0_commands = {
+            command: partial(self._handle_room0_lesson, lesson)
+            for command, lesson in _ROOM0_LESSON_COMMANDS.items()
+        }
+        room0_commands.update(dict.fromkeys(("learn", "teach", "lesson", "next"), self._room0_learn))
+        room0_commands["east"] = self._room0_east
+        
+        remove_phi3 = dict.fromkeys(
+            ("ollama rm phi3:mini", "remove", "remove phi3", "remove phi3 mini"),
+            self._remove_phi3_mini,
+        )
+        riddle_hint = dict.fromkeys(("riddle", "attempt", "try riddle", "solve"), self._room2_riddle_hint)
+        
+        self._room_commands: Tuple[Dict[str, Callable[[], None]], ...] = (
+            # Room 0: Ollama Village
+            room0_commands,
+            # Room 1: Summoning Chamber
+            {
+                "ollama pull phi3:mini": self._room1_pull,
+                self._phi3.summon_scroll.lower(): self._room1_pull,
+                "ollama list": self._room1_list,
+                "west": partial(self._move_to_room, 0),
+                "east": self._room1_east,
+            },
+            # Room 2: Riddle Hall
+            {
+                "west": partial(self._move_to_room, 1),
+                "east": self._room2_east,
+                "ollama run phi3:mini": self._run_phi3_riddle,
+                "ollama run llama3:8b": self._run_llama3_riddle,
+                **riddle_hint,
+            },
+            # Room 3: Upgrade Forge
+            {
+                "west": partial(self._move_to_room, 2),
+                "east": self._room3_east,
+                "ollama list": self._room3_list,
+                "ollama show phi3:mini": self._room3_show,
+                **remove_phi3,
+                "ollama pull llama3:8b": self._summon_llama3,
+                self._llama3.summon_scroll.lower(): self._summon_llama3,
+            },
+            # Room 4: Victory Chamber
+            {
+                "west": partial(self._move_to_room, 3),
+                "ollama apprentice": self._unlock_victory,
+                "descend": self._room4_descend,
+            },
+        )
+        self._room_fallbacks = (
+            self._room0_unknown,
+            self._room1_unknown,
+            self._room2_unknown,
+            self._room3_unknown,
+            self._room4_unknown,
+        )
+        
+        # Commands available in every room, checked after the room's own
+        self._commands = {
+            "quit": self._handle_quit,
+            "exit": self._handle_quit,
+            "help": self._handle_help,
+            "status": self._handle_status,
+            "tips": self._handle_tips,
+            "look": self._handle_look,
+            "l": self._handle_look,
+            "ls": self._handle_ls,
+            "pwd": self._handle_pwd,
+            "map": self._handle_map,
+        }
+    
+    @staticmethod
+    def _read_json(path: str) -> list:
+        """
+        Parse a JSON data file.
+        
+        Args:
+            path: Path to the JSON file
+            
+        Returns:
+            The parsed list of entries
+        """
+        # json.loads detects UTF-8 from raw bytes, skipping the text-mode decoder
+        with open(path, 'rb') as f:
+            return json.loads(f.read())
     
     def start(self) -> None:
         """Start the game and enter the main game loop."""
@@ -85,539 +437,416 @@ class GameEngine:
         print("You are about to embark on a journey to master Ollama and local LLMs.")
         print("\nType 'help' at any time to see available commands.\n")
         
-        input("Press Enter to begin your quest...")
+        self._read_line("Press Enter to begin your quest...")
         
         # Enter the first room
         self.current_room.enter(self.player)
         
         # Main game loop
+        self._enable_completion()
         self.game_loop()
     
+    def _enable_completion(self) -> None:
+        """Offer tab completion of commands when playing at a terminal."""
+        if not self._stdin.isatty():
+            return
+        
+        try:
+            import readline
+        except ImportError:  # Not available on every platform
+            return
+        
+        # Complete whole commands such as "ollama pull phi3:mini", not words
+        readline.set_completer(self._complete_command)
+        readline.set_completer_delims("")
+        if "libedit" in (readline.__doc__ or ""):
+            readline.parse_and_bind("bind ^I rl_complete")
+        else:
+            readline.parse_and_bind("tab: complete")
+    
+    def _complete_command(self, text: str, state: int) -> Optional[str]:
+        """
+        Complete a partly typed command for readline.
+        
+        Candidates are the current room's commands plus the global ones.
+        
+        Args:
+            text: What the player has typed so far
+            state: Index of the match readline is asking for
+            
+        Returns:
+            The matching command at that index, or None once they run out
+        """
+        text = text.lower()
+        commands = self._room_commands[self.player.current_room].keys() | self._commands.keys()
+        matches = sorted(command for command in commands if command.startswith(text))
+        return matches[state] if state < len(matches) else None
+    
     def game_loop(self) -> None:
         """Main game loop that processes player commands."""
-        while self.game_running:
-            try:
-                # Show prompt
-                prompt = f"\n[Room {self.player.current_room}]> "
-                user_input = input(prompt).strip()
-                
-                if not user_input:
-                    continue
-                
-                # Process command
-                self.process_command(user_input)
-                
-            except KeyboardInterrupt:
-                print("\n\nGame interrupted. Type 'quit' to exit properly.")
-            except Exception as e:
-                print(f"\n⚠️  An error occurred: {e}")
-                print("Please try again or type 'help' for available commands.")
+        # Block-buffer stdout so each turn's output goes out in as few writes
+        # as possible; prompts and pause() flush whenever the player must see it
+        stdout = sys.stdout
+        reconfigurable = hasattr(stdout, "reconfigure")
+        if reconfigurable:
+            line_buffering = stdout.line_buffering
+            stdout.reconfigure(line_buffering=False)
+        
+        try:
+            while True:
+                try:
+                    # Show prompt
+                    user_input = self._read_line(_PROMPTS[self.player.current_room])
+                    
+                    if not user_input:
+                        continue
+                    
+                    # Process command
+                    self.process_command(user_input)
+                    
+                except EOFError:
+                    # Input has run out (e.g. a piped script ended)
+                    self._handle_quit()
+                except KeyboardInterrupt:
+                    print("\n\nGame interrupted. Type 'quit' to exit properly.")
+                except Exception as e:
+                    print(f"\n⚠️  An error occurred: {e}")
+                    print("Please try again or type 'help' for available commands.")
+        except _QuitGame:
+            pass
+        finally:
+            # Hand stdout back with the buffering it had before the game began
+            if reconfigurable:
+                stdout.reconfigure(line_buffering=line_buffering)
     
     def process_command(self, command: str) -> None:
         """
         Process a player command.
         
+        Room-specific commands are checked first since they make up most of
+        the player's input; global commands are only tried when the current
+        room does not recognise the command.
+        
         Args:
             command: The command string entered by the player
         """
-        command = command.lower().strip()
-        
-        # Basic commands
-        if command in ["quit", "exit"]:
-            self._handle_quit()
-        elif command == "help":
-            self._handle_help()
-        elif command == "status":
-            self._handle_status()
-        elif command == "tips":
-            self._handle_tips()
-        elif command in ["look", "l"]:
-            self._handle_look()
-        elif command == "ls":
-            self._handle_ls()
-        elif command == "pwd":
-            self._handle_pwd()
-        elif command == "map":
-            self._handle_map()
-        
-        # Room 0: Ollama Village
-        elif self.player.current_room == 0:
-            self._handle_room0_commands(command)
-        
-        # Room 1: Summoning Chamber
-        elif self.player.current_room == 1:
-            self._handle_room1_commands(command)
-        
-        # Room 2: Riddle Hall
-        elif self.player.current_room == 2:
-            self._handle_room2_commands(command)
-        
-        # Room 3: Upgrade Forge
-        elif self.player.current_room == 3:
-            self._handle_room3_commands(command)
-        
-        # Room 4: Victory Chamber
-        elif self.player.current_room == 4:
-            self._handle_room4_commands(command)
-        
-        else:
-            print(f"Unknown command: '{command}'. Type 'help' for available commands.")
-    
-    def _handle_room0_commands(self, command: str) -> None:
-        """Handle commands specific to Room 0 (Ollama Village)."""
-        
-        # Room 0: User types 'learn' to begin (only time 'learn' is used)
-        if command in ["learn", "teach", "lesson", "next"]:
-            if not self.player.has_completed_objective("room0_lesson1_taught"):
-                display_shaman()
-                self._teach_install()
-                self.player.complete_objective("room0_lesson1_taught")
-            else:
-                print("\n💡 Hint: You've already started your training!")
-                print("Try practicing the commands you've learned.")
-        
-        # Lesson 1: User must type 'ollama' to complete
-        elif command == "ollama":
-            if not self.player.has_completed_objective("room0_lesson1_taught"):
-                print("\n⚠️  Please type 'learn' first to begin your training.")
-            elif self.player.has_completed_objective("room0_lesson1"):
-                print("\n✅ You've already learned this command! Continue with the next lesson.")
-            else:
-                display_shaman()
-                self._complete_lesson1()
-        
-        # Lesson 2: User must type 'ollama serve' to complete
-        elif command == "ollama serve":
-            if not self.player.has_completed_objective("room0_lesson2"):
-                if not self.player.has_completed_objective("room0_lesson1"):
-                    print("\n⚠️  Please complete the previous lessons first.")
-                else:
-                    display_shaman()
-                    self._complete_lesson2()
-            else:
-                print("\n✅ You've already learned this command! Continue with the next lesson.")
-        
-        # Lesson 3: User must type 'ollama list' to complete
-        elif command == "ollama list":
-            if not self.player.has_completed_objective("room0_lesson3"):
-                if not self.player.has_completed_objective("room0_lesson2"):
-                    print("\n⚠️  Please complete the previous lessons first.")
-                else:
-                    display_shaman()
-                    self._complete_lesson3()
-            else:
-                # Allow list command anytime after lesson 3
-                self.ollama.list_models()
-        
-        # Lesson 4: User must type 'ollama pull phi3:mini' to complete
-        elif command == "ollama pull phi3:mini":
-            if not self.player.has_completed_objective("room0_lesson4"):
-                if not self.player.has_completed_objective("room0_lesson3"):
-                    print("\n⚠️  Please complete the previous lessons first.")
-                else:
-                    display_shaman()
-                    self._complete_lesson4()
-            else:
-                # Allow pull command anytime after lesson 4
-                self.ollama.pull_model("phi3-mini")
-        
-        # Lesson 5: User must type 'ollama run phi3:mini' to complete
-        elif command == "ollama run phi3:mini":
-            if not self.player.has_completed_objective("room0_lesson5"):
-                if not self.player.has_completed_objective("room0_lesson4"):
-                    print("\n⚠️  Please complete the previous lessons first.")
-                else:
-                    display_shaman()
-                    self._complete_lesson5()
-            else:
-                print("\n✅ You've already learned this command!")
-        
-        # Lesson 6: User must type 'ollama show phi3:mini' to complete
-        elif command == "ollama show phi3:mini":
-            if not self.player.has_completed_objective("room0_lesson6"):
-                if not self.player.has_completed_objective("room0_lesson5"):
-                    print("\n⚠️  Please complete the previous lessons first.")
-                else:
-                    display_shaman()
-                    self._complete_lesson6()
-            else:
-                # Allow show command anytime after lesson 6
-                self.ollama.show_model("phi3-mini")
-        
-        # Lesson 7: User must type 'ollama rm phi3:mini' to complete
-        elif command == "ollama rm phi3:mini":
-            if not self.player.has_completed_objective("room0_lesson7"):
-                if not self.player.has_completed_objective("room0_lesson6"):
-                    print("\n⚠️  Please complete the previous lessons first.")
-                else:
-                    display_shaman()
-                    self._complete_lesson7()
-            else:
-                # Allow rm command anytime after lesson 7
-                self.ollama.remove_model("phi3-mini")
+        command = command.strip().lower()
+        room_id = self.player.current_room
         
-        elif command == "east":
-            if self.player.has_completed_objective("room0_complete"):
-                self._move_to_room(1)
-            else:
-                print("\n⚠️  The Shaman blocks your path.")
-                print("'You must complete all lessons first, young one.'")
-                if not self.player.has_completed_objective("room0_lesson1_taught"):
-                    print("Hint: Type 'learn' to begin your training.")
-                else:
-                    print("Hint: Practice the commands you've learned!")
+        # Stage 1: exact commands understood by the current room (hot path),
+        # then the commands available in every room
+        handler = self._room_commands[room_id].get(command) or self._commands.get(command)
+        if handler is not None:
+            handler()
         
+        # Stage 2: the room's hints for anything else
         else:
-            print(f"\nUnknown command. Type 'help' for available commands.")
-            if not self.player.has_completed_objective("room0_lesson1_taught"):
-                print("Hint: Type 'learn' to receive the Shaman's teachings!")
+            self._room_fallbacks[room_id](command)
     
-    def _teach_install(self) -> None:
-        """Teach the player about installing Ollama."""
-        
-        slow_print("\n=== LESSON 1: Installing Ollama ===\n", 0.5)
-        slow_print("The Shaman speaks:")
-        slow_print("'Before you can wield the power of local LLMs, you must first")
-        slow_print("install the Ollama tool on your system.'\n")
-        
-        slow_print("'This dungeon is a SIMULATION that teaches you the exact commands")
-        slow_print("you'll need when you're ready to install Ollama for real.")
-        slow_print("No installation is required to play this game!'\n")
-        
-        slow_print("For installation instructions when you're ready, visit:")
-        slow_print("  https://ollama.com/download\n")
-        
-        slow_print("'Once installed and running, all commands inside Ollama begin with \"ollama\".")
-        slow_print("Ollama gives you command-line access to powerful language models")
-        slow_print("that run entirely on your own machine.'\n")
+    @staticmethod
+    def _emit(*lines: str) -> None:
+        """
+        Write several lines of output in a single call.
         
-        slow_print("Now, let's practice the command. Type: ollama")
+        Args:
+            *lines: The lines to write, each followed by a newline
+        """
+        sys.stdout.write("\n".join(lines) + "\n")
     
-    def _complete_lesson1(self) -> None:
-        """Complete lesson 1 by typing 'ollama'."""
-        
-        print("\n✅ Correct! The `ollama` command is your gateway to LLM management.")
-        print()
-        
-        self.player.complete_objective("room0_lesson1")
+    def _read_line(self, prompt: str) -> str:
+        """
+        Prompt for and read one line of input.
         
-        slow_print("=== LESSON 2: Starting the Ollama Service ===\n", 0.5)
-        slow_print("The Shaman demonstrates:")
-        slow_print("'The `ollama serve` command starts the Ollama daemon in the background.")
-        slow_print("This service listens for requests and manages your LLM models.")
-        slow_print("On most systems, this starts automatically, but it's good to know!'\n")
+        Every prompt in the game goes through here, so a different front
+        end only has to replace this method. At a terminal this is input(),
+        with its line editing. When input is piped in, the prompt is
+        flushed and the line read straight from stdin, which skips
+        readline setup.
         
-        slow_print("Now, practice this command. Type: ollama serve")
+        Args:
+            prompt: Text shown before reading
+            
+        Returns:
+            The line entered, with surrounding whitespace stripped
+            
+        Raises:
+            EOFError: If input has run out, as input() would
+        """
+        stdin = self._stdin
+        if stdin.isatty():
+            return input(prompt).strip()
+        
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        line = stdin.readline()
+        if not line:
+            raise EOFError
+        return line.strip()
     
-    def _complete_lesson2(self) -> None:
-        """Complete lesson 2 by typing 'ollama serve'."""
-        
-        print()
-        self.ollama.serve()
-        print()
-        
-        self.player.complete_objective("room0_lesson2")
+    def _hint(self, text: str) -> None:
+        """
+        Print a follow-up hint unless hints are turned off.
         
-        slow_print("✅ Lesson 2 Complete!\n", 0.5)
-        slow_print("=== LESSON 3: Listing Your Models ===\n")
-        slow_print("The Shaman explains:")
-        slow_print("'To see which models you have installed, use: ollama list'")
-        slow_print("'This command will be useful to verify your models after pulling them.'\n")
+        Setting GAME_VERBOSE=0 silences these hints for scripted or
+        headless runs; the messages they follow are always printed.
         
-        slow_print("Practice this command now. Type: ollama list")
+        Args:
+            text: The hint line to print
+        """
+        if self.verbose:
+            print(text)
     
-    def _complete_lesson3(self) -> None:
-        """Complete lesson 3 by typing 'ollama list'."""
-        
-        print()
-        self.ollama.list_models()
-        print()
-        
-        self.player.complete_objective("room0_lesson3")
+    def _room0_learn(self) -> None:
+        """Room 0: 'learn' begins the Shaman's training (only time it is used)."""
+        if self.player.next_lesson_index == 0:
+            display_shaman()
+            self._teach_install()
+            self.player.complete_lesson("room0_lesson1_taught")
+        else:
+            print("\n💡 Hint: You've already started your training!")
+            print("Try practicing the commands you've learned.")
+    
+    def _room0_east(self) -> None:
+        """Room 0: leave for the Summoning Chamber once every lesson is done."""
+        if "room0_complete" in self.player.completed_objectives:
+            self._move_to_room(1)
+        else:
+            print("\n⚠️  The Shaman blocks your path.")
+            print("'You must complete all lessons first, young one.'")
+            if self.player.next_lesson_index == 0:
+                self._hint("Hint: Type 'learn' to begin your training.")
+            else:
+                self._hint("Hint: Practice the commands you've learned!")
+    
+    def _room0_unknown(self, command: str) -> None:
+        """Room 0: respond to a command the village does not recognise."""
+        print("\n" + _MSG_UNKNOWN_COMMAND)
+        if self.player.next_lesson_index == 0:
+            self._hint("Hint: Type 'learn' to receive the Shaman's teachings!")
+    
+    def _handle_room0_lesson(self, lesson: int) -> None:
+        """
+        Run, gate or repeat an Ollama Village lesson command.
         
-        slow_print("✅ Lesson 3 Complete!\n", 0.5)
-        slow_print("The Shaman nods:")
-        slow_print("'You haven't pulled any models yet. Let's learn how to do that next!\n")
+        Args:
+            lesson: Number of the lesson the command belongs to (1-7)
+        """
+        progress = self.player.next_lesson_index
         
-        slow_print("=== LESSON 4: Pulling (Downloading) Models ===\n")
-        slow_print("The Shaman teaches the most important command:")
-        slow_print("'To download a model, use: ollama pull <model-name>'")
-        slow_print("'Each model has a size - smaller models are faster but less capable.")
-        slow_print("Phi3 Mini is about 2.3 GB. Larger models like Llama3 are 4-5 GB.")
-        slow_print("Choose based on your needs and available disk space!'\n")
+        if progress < lesson:
+            if lesson == 1:
+                print("\n⚠️  Please type 'learn' first to begin your training.")
+            else:
+                print("\n⚠️  Please complete the previous lessons first.")
+        elif progress > lesson:
+            # Lesson already learned - some commands may be practiced again
+            self._room0_lesson_repeats[lesson]()
+        else:
+            display_shaman()
+            self._run_lesson(lesson)
+    
+    def _teach_install(self) -> None:
+        """Teach the player about installing Ollama."""
         
-        slow_print("Now, let's pull the phi3:mini model. Type: ollama pull phi3:mini")
+        heading, teaching = INSTALL_LESSON
+        slow_print(heading, 0.5)
+        slow_print(teaching)
     
-    def _complete_lesson4(self) -> None:
-        """Complete lesson 4 by typing 'ollama pull phi3:mini'."""
+    def _run_lesson(self, lesson: int) -> None:
+        """
+        Complete an Ollama Village lesson and teach the next one.
+        
+        Shows the result of the practised command, records the lesson and
+        paces out the Shaman's debrief. The last lesson also completes
+        the village.
         
+        Args:
+            lesson: Number of the lesson being completed (1-7)
+        """
         print()
-        self.ollama.pull_model("phi3-mini")
+        self._room0_lesson_actions[lesson]()
         print()
         
-        self.player.complete_objective("room0_lesson4")
+        player = self.player
+        player.complete_lesson(f"room0_lesson{lesson}")
+        if lesson == len(LESSON_DEBRIEFS) - 1:
+            player.finalize_room(self.current_room, "room0_complete")
         
-        slow_print("✅ Lesson 4 Complete!\n", 0.5)
-        slow_print("=== LESSON 5: Running Models ===\n")
-        slow_print("The Shaman demonstrates:")
-        slow_print("'Once a model is pulled, you can chat with it using: ollama run <model-name>'\n")
-        
-        slow_print("Example:")
-        slow_print("  $ ollama run phi3:mini")
-        slow_print("  >>> Tell me about AI")
-        slow_print("  [The model responds with information about AI...]")
-        slow_print("  >>> /bye\n")
-        
-        slow_print("'This is how you interact with your local LLM assistants!'\n")
-        
-        slow_print("Practice running the model. Type: ollama run phi3:mini")
+        heading, teaching = LESSON_DEBRIEFS[lesson]
+        slow_print(heading, 0.5)
+        slow_print(teaching)
     
-    def _complete_lesson5(self) -> None:
-        """Complete lesson 5 by typing 'ollama run phi3:mini'."""
-        
-        print()
+    def _simulate_phi3_run(self) -> None:
+        """Lesson 5's practice: pretend to start a chat with phi3:mini."""
         slow_print("🤖 Simulating: ollama run phi3:mini\n", 0.5)
         slow_print("Sidekick phi3:mini activated successfully!")
-        print()
-        
-        self.player.complete_objective("room0_lesson5")
-        
-        slow_print("✅ Lesson 5 Complete!\n", 0.5)
-        slow_print("=== LESSON 6: Inspecting Model Information ===\n")
-        slow_print("The Shaman demonstrates:")
-        slow_print("'To see detailed information about a model, use: ollama show <model-name>'")
-        slow_print("'This displays the model's architecture, parameters, and configuration.")
-        slow_print("It's useful for understanding what you're working with!'\n")
-        
-        slow_print("Example:")
-        slow_print("  $ ollama show phi3:mini")
-        slow_print("  [Shows model architecture, parameters, quantization, etc...]\n")
-        
-        slow_print("Practice inspecting the model. Type: ollama show phi3:mini")
     
-    def _complete_lesson6(self) -> None:
-        """Complete lesson 6 by typing 'ollama show phi3:mini'."""
-        
-        print()
-        self.ollama.show_model("phi3-mini")
-        print()
-        
-        self.player.complete_objective("room0_lesson6")
-        
-        slow_print("✅ Lesson 6 Complete!\n", 0.5)
-        slow_print("=== LESSON 7: Removing Models ===\n")
-        slow_print("The Shaman explains the final command:")
-        slow_print("'Models take up disk space. When you no longer need one,")
-        slow_print("you can remove it with: ollama rm <model-name>'")
-        slow_print("'This frees up space for other models. You can always pull it again later!")
-        slow_print("Good model management keeps your system tidy and efficient.'\n")
-        
-        slow_print("Practice removing the model. Type: ollama rm phi3:mini")
+    def _room1_pull(self) -> None:
+        """Room 1: pull and summon Phi3 Mini."""
+        if "room1_pulled" not in self.player.completed_objectives:
+            phi3 = self._phi3
+            
+            # Correct summon command - pull the model first
+            print("\n📥 Pulling the Phi3 Mini model...")
+            self.ollama.pull_model("phi3-mini")
+            
+            # Then summon
+            print(phi3.summon())
+            self.player.set_active_sidekick(phi3)
+            
+            # Mark pull objective complete
+            self.player.complete_objective("room1_pulled")
+            
+            print()
+            slow_print("✅ Model pulled successfully!\n", 0.5)
+            slow_print("Before continuing, verify your model is ready.")
+            slow_print("Type: ollama list")
+        else:
+            print("\n✅ You've already pulled this model!")
+            print("Try: ollama list")
     
-    def _complete_lesson7(self) -> None:
-        """Complete lesson 7 by typing 'ollama rm phi3:mini'."""
+    def _room1_list(self) -> None:
+        """Room 1: list models, completing the room after the first pull."""
+        completed = self.player.completed_objectives
+        if "room1_pulled" not in completed:
+            print("\n⚠️  You need to pull a model first!")
+            print("Try: ollama pull phi3:mini")
+            return
         
         print()
-        self.ollama.remove_model("phi3-mini")
-        print()
-        
-        self.player.complete_objective("room0_lesson7")
-        self.player.complete_objective("room0_complete")
-        self.current_room.mark_completed()
-        
-        slow_print("✅ Lesson 7 Complete!\n", 0.5)
-        slow_print("The Shaman smiles warmly:")
-        slow_print("'You have learned all the essential Ollama commands!")
-        slow_print("You are now ready to face the challenges ahead.'\n")
+        self.ollama.list_models()
         
-        slow_print("🎓 TRAINING COMPLETE! 🎓")
-        slow_print("You may now proceed east to the Summoning Chamber.")
-        slow_print("Type 'east' when you are ready.\n")
+        if "room1_complete" not in completed:
+            print()
+            slow_print("✅ Perfect! You can see phi3-mini is now available as a sidekick.", 0.5)
+            slow_print("This command helps you track which models are ready to use.")
+            
+            # Unlock tip
+            self.player.unlock_tip("tip_04", self._tip_cache["tip_04"])
+            
+            # Mark objective complete
+            self.player.finalize_room(self.current_room, "room1_complete")
+            
+            print()
+            slow_print("✅ Objective Complete!")
+            slow_print("You've learned to summon a sidekick using Ollama commands.")
+            slow_print("\nYou can now proceed to the next room.")
+            slow_print("Type 'east' to continue your journey.")
     
-    def _handle_room1_commands(self, command: str) -> None:
-        """Handle commands specific to Room 1 (Summoning Chamber)."""
-        
-        # Check for real Ollama command
-        phi3 = self.sidekicks["Phi3 Mini"]
-        
-        if command == "ollama pull phi3:mini" or command == phi3.summon_scroll.lower():
-            if not self.player.has_completed_objective("room1_pulled"):
-                # Correct summon command - pull the model first
-                print("\n📥 Pulling the Phi3 Mini model...")
-                self.ollama.pull_model("phi3-mini")
-                
-                # Then summon
-                print(phi3.summon())
-                self.player.set_active_sidekick(phi3)
-                
-                # Mark pull objective complete
-                self.player.complete_objective("room1_pulled")
-                
-                print()
-                slow_print("✅ Model pulled successfully!\n", 0.5)
-                slow_print("Before continuing, verify your model is ready.")
-                slow_print("Type: ollama list")
-            else:
-                print("\n✅ You've already pulled this model!")
-                print("Try: ollama list")
-        
-        elif command == "ollama list":
-            if not self.player.has_completed_objective("room1_pulled"):
-                print("\n⚠️  You need to pull a model first!")
+    def _room1_east(self) -> None:
+        """Room 1: leave for the Riddle Hall once the model is verified."""
+        completed = self.player.completed_objectives
+        if "room1_complete" in completed:
+            self._move_to_room(2)
+        else:
+            print("\n" + _MSG_OBJECTIVES_FIRST)
+            if "room1_pulled" not in completed:
                 print("Try: ollama pull phi3:mini")
             else:
-                print()
-                self.ollama.list_models()
-                
-                if not self.player.has_completed_objective("room1_complete"):
-                    print()
-                    slow_print("✅ Perfect! You can see phi3-mini is now available as a sidekick.", 0.5)
-                    slow_print("This command helps you track which models are ready to use.")
-                    
-                    # Unlock tip
-                    self.player.unlock_tip("tip_04", self.tips["tip_04"]["text"])
-                    
-                    # Mark objective complete
-                    self.player.complete_objective("room1_complete")
-                    self.current_room.mark_completed()
-                    
-                    print()
-                    slow_print("✅ Objective Complete!")
-                    slow_print("You've learned to summon a sidekick using Ollama commands.")
-                    slow_print("\nYou can now proceed to the next room.")
-                    slow_print("Type 'east' to continue your journey.")
-        
-        elif command == "west":
-            self._move_to_room(0)
-        
-        elif command == "east":
-            if self.player.has_completed_objective("room1_complete"):
-                self._move_to_room(2)
-            else:
-                print("\n⚠️  You must complete this room's objectives first!")
-                if not self.player.has_completed_objective("room1_pulled"):
-                    print("Try: ollama pull phi3:mini")
-                else:
-                    print("Try: ollama list")
-        
-        elif "ollama" in command and "pull" in command:
+                print("Try: ollama list")
+    
+    def _room1_unknown(self, command: str) -> None:
+        """Room 1: hint at the pull command for anything else."""
+        if command.startswith(_PULL_PREFIX):
             print("\n❌ That's not quite right.")
             print("Make sure to use the exact command: ollama pull phi3:mini")
         
-        elif "summon" in command:
+        elif command.startswith(_SUMMON_PREFIX):
             print("\n💡 Hint: In the real world, we use Ollama commands, not scroll text!")
             print("Try: ollama pull phi3:mini")
         
         else:
-            print(f"\nUnknown command. Type 'help' for available commands.")
-            if not self.player.has_completed_objective("room1_pulled"):
-                print("Hint: Try the command shown on the scroll: ollama pull phi3:mini")
+            print("\n" + _MSG_UNKNOWN_COMMAND)
+            if "room1_pulled" not in self.player.completed_objectives:
+                self._hint("Hint: Try the command shown on the scroll: ollama pull phi3:mini")
             else:
-                print("Hint: Verify your models with: ollama list")
+                self._hint("Hint: Verify your models with: ollama list")
     
-    def _handle_room2_commands(self, command: str) -> None:
-        """Handle commands specific to Room 2 (Riddle Hall)."""
-        if command == "west":
-            self._move_to_room(1)
-        
-        elif command == "east":
-            if self.player.has_completed_objective("room2_complete"):
-                self._move_to_room(3)
-            else:
-                print("⚠️  You must complete this room's objectives first!")
-        
-        elif command == "ollama run phi3:mini":
-            self._run_phi3_riddle()
-        
-        elif command == "ollama run llama3:8b":
-            self._run_llama3_riddle()
-        
-        elif command in ["riddle", "attempt", "try riddle", "solve"]:
-            print("💡 Hint: Use the Ollama run command to consult your sidekick!")
-            if self.player.active_sidekick:
-                if self.player.active_sidekick.name == "Phi3 Mini":
-                    print("Try: ollama run phi3:mini")
-                elif self.player.active_sidekick.name == "Llama3 8b":
-                    print("Try: ollama run llama3:8b")
-        
+    def _room2_east(self) -> None:
+        """Room 2: leave for the Upgrade Forge once the riddle is solved."""
+        if "room2_complete" in self.player.completed_objectives:
+            self._move_to_room(3)
         else:
-            print(f"Unknown command. Type 'help' for available commands.")
-            if self.player.active_sidekick:
-                if self.player.active_sidekick.name == "Phi3 Mini":
-                    print("Hint: Try 'ollama run phi3:mini' to consult your sidekick!")
-                elif self.player.active_sidekick.name == "Llama3 8b":
-                    print("Hint: Try 'ollama run llama3:8b' to consult your sidekick!")
+            print(_MSG_OBJECTIVES_FIRST)
     
-    def _handle_room3_commands(self, command: str) -> None:
-        """Handle commands specific to Room 3 (Upgrade Forge)."""
-        if command == "west":
-            self._move_to_room(2)
-        
-        elif command == "east":
-            if not self.player.has_completed_objective("room3_complete"):
-                print("⚠️  You must complete this room's objectives first!")
-            elif not self.player.has_discovered_password():
-                print("⚠️  The Victory Chamber is locked!")
-                print("You need to discover the password first.")
-                print("Hint: Go WEST to the Riddle Hall and use Llama3 8b to solve the riddle!")
-            else:
-                self._move_to_room(4)
-        
-        elif command == "ollama list":
-            print()
-            self.ollama.list_models()
-            print()
-        
-        elif command == "ollama show phi3:mini":
-            print()
-            self.ollama.show_model("phi3-mini")
-            if not self.player.has_completed_objective("room3_inspected"):
-                print("💡 The 'ollama show' command is useful for inspecting model details")
-                print("before deciding whether to keep or remove them.\n")
-                self.player.complete_objective("room3_inspected")
-        
-        elif command in ["ollama rm phi3:mini", "remove", "remove phi3", "remove phi3 mini"]:
-            self._remove_phi3_mini()
-        
-        elif command == "ollama pull llama3:8b" or command == self.sidekicks["Llama3 8b"].summon_scroll.lower():
-            self._summon_llama3()
-        
-        elif "ollama" in command and "pull" in command and "llama" in command:
+    def _room2_riddle_hint(self) -> None:
+        """Room 2: point 'riddle' and friends at the Ollama run command."""
+        print("💡 Hint: Use the Ollama run command to consult your sidekick!")
+        sidekick = self.player.active_sidekick
+        if sidekick:
+            if sidekick is self._phi3:
+                print("Try: ollama run phi3:mini")
+            elif sidekick is self._llama3:
+                print("Try: ollama run llama3:8b")
+    
+    def _room2_unknown(self, command: str) -> None:
+        """Room 2: suggest consulting the active sidekick."""
+        print(_MSG_UNKNOWN_COMMAND)
+        sidekick = self.player.active_sidekick
+        if sidekick:
+            if sidekick is self._phi3:
+                self._hint("Hint: Try 'ollama run phi3:mini' to consult your sidekick!")
+            elif sidekick is self._llama3:
+                self._hint("Hint: Try 'ollama run llama3:8b' to consult your sidekick!")
+    
+    def _room3_east(self) -> None:
+        """Room 3: leave for the Victory Chamber once the password is known."""
+        if "room3_complete" not in self.player.completed_objectives:
+            print(_MSG_OBJECTIVES_FIRST)
+        elif not self.player.has_discovered_password():
+            print("⚠️  The Victory Chamber is locked!")
+            print("You need to discover the password first.")
+            self._hint("Hint: Go WEST to the Riddle Hall and use Llama3 8b to solve the riddle!")
+        else:
+            self._move_to_room(4)
+    
+    def _room3_list(self) -> None:
+        """Room 3: list the installed models."""
+        print()
+        self.ollama.list_models()
+        print()
+    
+    def _room3_show(self) -> None:
+        """Room 3: inspect Phi3 Mini before deciding to remove it."""
+        print()
+        self.ollama.show_model("phi3-mini")
+        if "room3_inspected" not in self.player.completed_objectives:
+            print("💡 The 'ollama show' command is useful for inspecting model details")
+            print("before deciding whether to keep or remove them.\n")
+            self.player.complete_objective("room3_inspected")
+    
+    def _room3_unknown(self, command: str) -> None:
+        """Room 3: hint at the upgrade commands for anything else."""
+        if command.startswith(_PULL_PREFIX):
             print("❌ Not quite right. Remember the exact command:")
             print("ollama pull llama3:8b")
         
-        elif "summon" in command and "llama" in command:
+        elif command.startswith(_SUMMON_LLAMA_PREFIXES):
             print("💡 Hint: Use the real Ollama command, not scroll text!")
             print("Try: ollama pull llama3:8b")
         
         else:
-            print(f"Unknown command. Type 'help' for available commands.")
-            if not self.player.has_completed_objective("room3_inspected"):
-                print("Hint: Try 'ollama show phi3:mini' to inspect your current model!")
+            print(_MSG_UNKNOWN_COMMAND)
+            if "room3_inspected" not in self.player.completed_objectives:
+                self._hint("Hint: Try 'ollama show phi3:mini' to inspect your current model!")
             else:
-                print("Hint: Use 'ollama rm phi3:mini', then 'ollama pull llama3:8b'!")
+                self._hint("Hint: Use 'ollama rm phi3:mini', then 'ollama pull llama3:8b'!")
     
-    def _handle_room4_commands(self, command: str) -> None:
-        """Handle commands specific to Room 4 (Victory Chamber)."""
-        if command == "west":
-            self._move_to_room(3)
-        
-        elif command == "ollama apprentice":
-            self._unlock_victory()
-        
-        elif command == "descend":
-            if self.player.has_completed_objective("room4_complete"):
-                self._handle_descend()
-            else:
-                print("\n⚠️  You must unlock the Victory Chamber first!")
-                print("Hint: Enter the password revealed by Llama3 8b!")
-        
+    def _room4_descend(self) -> None:
+        """Room 4: descend to the deeper levels once the chamber is unlocked."""
+        if "room4_complete" in self.player.completed_objectives:
+            self._handle_descend()
         else:
-            print(f"\nUnknown command. Type 'help' for available commands.")
-            if not self.player.has_completed_objective("room4_complete"):
-                print("Hint: Enter the password revealed by Llama3 8b!")
-            else:
-                print("Hint: Type 'descend' to proceed to the Tokenizer Tomb!")
+            print("\n⚠️  You must unlock the Victory Chamber first!")
+            self._hint("Hint: Enter the password revealed by Llama3 8b!")
+    
+    def _room4_unknown(self, command: str) -> None:
+        """Room 4: remind the player of the password or the way down."""
+        print("\n" + _MSG_UNKNOWN_COMMAND)
+        if "room4_complete" not in self.player.completed_objectives:
+            self._hint("Hint: Enter the password revealed by Llama3 8b!")
+        else:
+            self._hint("Hint: Type 'descend' to proceed to the Tokenizer Tomb!")
     
     def _attempt_riddle_room2(self) -> None:
         """Handle riddle attempt in Room 2 with Phi3 Mini."""
@@ -625,15 +854,16 @@ class GameEngine:
             print("⚠️  You need an active sidekick to attempt the riddle!")
             return
         
-        if self.player.active_sidekick.name != "Phi3 Mini":
+        sidekick = self.player.active_sidekick
+        if sidekick is not self._phi3:
             print("⚠️  This is meant to be attempted with Phi3 Mini first.")
             return
         
         # Get the riddle
-        riddle = self.puzzles["riddle_01"]
+        riddle = self._riddle01
         
         # Have sidekick attempt it
-        success, response = self.player.active_sidekick.attempt_riddle(riddle)
+        success, response = sidekick.attempt_riddle(riddle)
         print(response)
         
         # Always complete the objective after attempting (the learning is in the attempt)
@@ -649,11 +879,10 @@ class GameEngine:
             print("Larger models have higher success rates for challenging problems.")
         
         # Unlock tip
-        self.player.unlock_tip("tip_01", self.tips["tip_01"]["text"])
+        self.player.unlock_tip("tip_01", self._tip_cache["tip_01"])
         
         # Mark objective complete
-        self.player.complete_objective("room2_complete")
-        self.current_room.mark_completed()
+        self.player.finalize_room(self.current_room, "room2_complete")
         
         print("\n✅ Objective Complete!")
         print("You've learned about the trade-offs of small models.")
@@ -661,18 +890,19 @@ class GameEngine:
     
     def _remove_phi3_mini(self) -> None:
         """Remove Phi3 Mini sidekick."""
-        if self.player.active_sidekick and self.player.active_sidekick.name == "Phi3 Mini":
+        sidekick = self.player.active_sidekick
+        if sidekick is self._phi3:
             # Simulate ollama remove
             print("\n🗑️  Executing: ollama rm phi3:mini")
             self.ollama.remove_model("phi3-mini")
             
             # Remove from player
-            message = self.player.active_sidekick.remove()
+            message = sidekick.remove()
             print(message)
             self.player.set_active_sidekick(None)
             
             # Unlock tip
-            self.player.unlock_tip("tip_03", self.tips["tip_03"]["text"])
+            self.player.unlock_tip("tip_03", self._tip_cache["tip_03"])
             
             print("Now you can summon a more powerful model!")
             print("Type: ollama pull llama3:8b")
@@ -686,13 +916,12 @@ class GameEngine:
         self.ollama.pull_model("llama3-8b")
         
         # Then summon
-        llama3 = self.sidekicks["Llama3 8b"]
+        llama3 = self._llama3
         print(llama3.summon())
         self.player.set_active_sidekick(llama3)
         
         # Mark objective complete
-        self.player.complete_objective("room3_complete")
-        self.current_room.mark_completed()
+        self.player.finalize_room(self.current_room, "room3_complete")
         
         print("\n✅ Objectives Complete!")
         print("You now have a powerful ally!")
@@ -701,63 +930,74 @@ class GameEngine:
     def _run_phi3_riddle(self) -> None:
         """Handle running phi3:mini with the strawberry riddle."""
         if not self.player.has_active_sidekick():
-            print("⚠️  You need to summon Phi3 Mini first!")
-            print("Go back to the Summoning Chamber (west) if you haven't summoned it yet.")
+            self._emit(
+                "⚠️  You need to summon Phi3 Mini first!",
+                "Go back to the Summoning Chamber (west) if you haven't summoned it yet.",
+            )
             return
         
-        if self.player.active_sidekick.name != "Phi3 Mini":
+        sidekick = self.player.active_sidekick
+        if sidekick is not self._phi3:
             print("⚠️  You don't have Phi3 Mini as your active sidekick.")
-            if self.player.active_sidekick.name == "Llama3 8b":
+            if sidekick is self._llama3:
                 print("It looks like you already upgraded! Try: ollama run llama3:8b")
             return
         
         # Simulate interactive session
-        print("\n🤖 Starting interactive session with phi3:mini...")
-        print("Type your question, or type '/bye' to exit.\n")
+        self._emit(
+            "\n🤖 Starting interactive session with phi3:mini...",
+            "Type your question, or type '/bye' to exit.\n",
+        )
         
         # Wait for user input
-        user_question = input(">>> ").strip()
+        question = self._read_line(">>> ").lower()
         
-        if user_question.lower() in ["/bye", "exit", "quit"]:
-            print("Exiting interactive session.\n")
+        if question in _SESSION_EXIT_COMMANDS:
+            print(_MSG_SESSION_EXIT)
             return
         
         # Check if it's about strawberry
-        if "strawberry" in user_question.lower() or "r" in user_question.lower():
+        if _RIDDLE_TRIGGER_RE.search(question):
             # Get the riddle and have phi3 attempt it with delays
-            riddle = self.puzzles["riddle_01"]
-            success = self.player.active_sidekick.attempt_riddle_with_delays(riddle)
+            riddle = self._riddle01
+            success = sidekick.attempt_riddle_with_delays(riddle)
             
-            print(">>> /bye")
-            print("Exiting interactive session.\n")
+            self._emit(">>> /bye", _MSG_SESSION_EXIT)
             
             # Provide feedback
             if not success:
-                print("💡 Learning Moment:")
-                print("Phi3 Mini is a small, efficient model but struggles with")
-                print("certain tasks like careful counting. This is a trade-off:")
-                print("smaller size = faster but less capable.")
+                self._emit(
+                    "💡 Learning Moment:",
+                    "Phi3 Mini is a small, efficient model but struggles with",
+                    "certain tasks like careful counting. This is a trade-off:",
+                    "smaller size = faster but less capable.",
+                )
             else:
-                print("💡 Learning Moment:")
-                print("Phi3 Mini got lucky this time! But with only a 20% success rate,")
-                print("small models aren't reliable for complex tasks like precise counting.")
-                print("Larger models have higher success rates for challenging problems.")
+                self._emit(
+                    "💡 Learning Moment:",
+                    "Phi3 Mini got lucky this time! But with only a 20% success rate,",
+                    "small models aren't reliable for complex tasks like precise counting.",
+                    "Larger models have higher success rates for challenging problems.",
+                )
             
             # Unlock tip
-            self.player.unlock_tip("tip_01", self.tips["tip_01"]["text"])
+            self.player.unlock_tip("tip_01", self._tip_cache["tip_01"])
             
             # Mark objective complete
-            self.player.complete_objective("room2_complete")
-            self.current_room.mark_completed()
+            self.player.finalize_room(self.current_room, "room2_complete")
             
-            print("\n✅ Objective Complete!")
-            print("You've learned about the trade-offs of small models.")
-            print("\nProceed east to the Upgrade Forge to get a more powerful ally!")
+            self._emit(
+                "\n✅ Objective Complete!",
+                "You've learned about the trade-offs of small models.",
+                "\nProceed east to the Upgrade Forge to get a more powerful ally!",
+            )
         else:
-            print(f"\nPhi3 Mini: That's an interesting question! However, the Oracle")
-            print("is waiting for you to ask about the riddle: 'How many r's are in strawberry?'")
-            print("\n>>> /bye")
-            print("Exiting interactive session.\n")
+            self._emit(
+                "\nPhi3 Mini: That's an interesting question! However, the Oracle",
+                "is waiting for you to ask about the riddle: 'How many r's are in strawberry?'",
+                "\n>>> /bye",
+                _MSG_SESSION_EXIT,
+            )
     
     def _run_llama3_riddle(self) -> None:
         """Handle running llama3:8b with the strawberry riddle."""
@@ -765,197 +1005,154 @@ class GameEngine:
             print("⚠️  You need to summon a sidekick first!")
             return
         
-        if self.player.active_sidekick.name != "Llama3 8b":
+        sidekick = self.player.active_sidekick
+        if sidekick is not self._llama3:
             print("⚠️  You don't have Llama3 8b as your active sidekick.")
-            if self.player.active_sidekick.name == "Phi3 Mini":
+            if sidekick is self._phi3:
                 print("You need to upgrade first. Go east to the Upgrade Forge!")
             return
         
         # Simulate interactive session
-        print("\n🤖 Starting interactive session with llama3:8b...")
-        print("Type your question, or type '/bye' to exit.\n")
+        self._emit(
+            "\n🤖 Starting interactive session with llama3:8b...",
+            "Type your question, or type '/bye' to exit.\n",
+        )
         
         # Wait for user input
-        user_question = input(">>> ").strip()
+        question = self._read_line(">>> ").lower()
         
-        if user_question.lower() in ["/bye", "exit", "quit"]:
-            print("Exiting interactive session.\n")
+        if question in _SESSION_EXIT_COMMANDS:
+            print(_MSG_SESSION_EXIT)
             return
         
         # Check if it's about strawberry
-        if "strawberry" in user_question.lower() or "r" in user_question.lower():
+        if _RIDDLE_TRIGGER_RE.search(question):
             # Get the riddle and have llama3 attempt it (should succeed)
-            riddle = self.puzzles["riddle_01"]
-            success = self.player.active_sidekick.attempt_riddle_with_delays(riddle)
+            riddle = self._riddle01
+            success = sidekick.attempt_riddle_with_delays(riddle)
             
             if success:
-                print("The Oracle's eyes glow with approval!")
-                print("\n✨ The treasure chest begins to glow with golden light! ✨")
-                print("Ancient locks click open one by one...")
-                print("The chest lid slowly rises, revealing a scroll inside.")
-                print("\nLlama3 8b continues: 'By the way, you've earned access to the Victory Chamber.'")
-                # Display password in cross-platform ASCII box
-                print("\nThe Oracle reveals:")
-                print("╔════════════════════════════════════╗")
-                print("║   PASSWORD: Ollama Apprentice     ║")
-                print("╚════════════════════════════════════╝")
-                print("\n>>> /bye")
-                print("Exiting interactive session.\n")
+                sys.stdout.write(_ORACLE_REVEAL_TEXT)
                 
                 # Unlock tip
-                self.player.unlock_tip("tip_02", self.tips["tip_02"]["text"])
+                self.player.unlock_tip("tip_02", self._tip_cache["tip_02"])
                 
                 # Mark that password is discovered
                 self.player.discover_password()
                 
-                print("🔑 Password discovered! You can now proceed to the Victory Chamber.")
-                print("Head EAST through the Forge to reach the Victory Chamber!")
+                self._emit(
+                    "🔑 Password discovered! You can now proceed to the Victory Chamber.",
+                    "Head EAST through the Forge to reach the Victory Chamber!",
+                )
             else:
-                print("\n>>> /bye")
-                print("Exiting interactive session.\n")
-                print("(Rare case: Even large models can occasionally fail. Try again!)")
+                self._emit(
+                    "\n>>> /bye",
+                    _MSG_SESSION_EXIT,
+                    "(Rare case: Even large models can occasionally fail. Try again!)",
+                )
         else:
-            print(f"\nLlama3 8b: That's an interesting question! However, the Oracle")
-            print("is waiting for you to ask about the riddle: 'How many r's are in strawberry?'")
-            print("\n>>> /bye")
-            print("Exiting interactive session.\n")
+            self._emit(
+                "\nLlama3 8b: That's an interesting question! However, the Oracle",
+                "is waiting for you to ask about the riddle: 'How many r's are in strawberry?'",
+                "\n>>> /bye",
+                _MSG_SESSION_EXIT,
+            )
     
     def _attempt_riddle_room4(self) -> None:
         """Handle riddle attempt in Room 4 with Llama3 8b."""
-        if not self.player.has_active_sidekick():
+        player = self.player
+        if not player.has_active_sidekick():
             print("⚠️  You need an active sidekick to attempt the riddle!")
             return
         
-        if self.player.active_sidekick.name != "Llama3 8b":
+        sidekick = player.active_sidekick
+        if sidekick is not self._llama3:
             print("⚠️  You should use Llama3 8b for this challenge.")
             return
         
         # Get the riddle
-        riddle = self.puzzles["riddle_01"]
+        riddle = self._riddle01
         
         # Have sidekick attempt it
-        success, response = self.player.active_sidekick.attempt_riddle(riddle)
+        success, response = sidekick.attempt_riddle(riddle)
         print(response)
         
         if success:
-            print("\n🎉 VICTORY! 🎉")
-            print("Llama3 8b successfully solved the riddle!")
+            self._emit("\n🎉 VICTORY! 🎉", "Llama3 8b successfully solved the riddle!")
             
             # Unlock tip
-            self.player.unlock_tip("tip_02", self.tips["tip_02"]["text"])
+            player.unlock_tip("tip_02", self._tip_cache["tip_02"])
             
-            # Award points
-            self.player.add_knowledge_points(100)
-            
-            # Mark complete
-            self.player.complete_objective("room4_complete")
-            self.current_room.mark_completed()
+            # Award points and mark complete
+            player.finalize_room(self.current_room, "room4_complete", points=100)
             
             # Show victory screen
             print()
             display_victory()
             
-            print("🏆 GROUND LEVEL COMPLETE! 🏆\n")
-            print(f"Final Knowledge Points: {self.player.knowledge_points}")
-            print(f"Tips Unlocked: {len(self.player.unlocked_tips)}/4")
-            
-            self.player.display_unlocked_tips(self.tips)
+            sys.stdout.write(
+                f"""🏆 GROUND LEVEL COMPLETE! 🏆
+
+Final Knowledge Points: {player.knowledge_points}
+Tips Unlocked: {len(player.unlocked_tips)}/{len(self.tips)}
+"""
+            )
             
-            print("\n" + "="*60)
-            print("Thank you for playing AI-LLM-Dungeon: Ground Level!")
-            print("You've learned the fundamentals of Ollama and LLM management.")
-            print("="*60 + "\n")
+            player.display_unlocked_tips(self.tips)
             
-            # Enable post-victory exploration
-            print("🌟 POST-VICTORY EXPLORATION ENABLED! 🌟")
-            print("\nYou can now freely explore the dungeon to review your learnings!")
-            print("Move between rooms using 'east' and 'west' commands.")
-            print("Visit any room to revisit what you learned:")
-            print("  • Room 0 (west): Ollama Village - Review basic commands")
-            print("  • Room 1 (west): Summoning Chamber - Model pulling")
-            print("  • Room 2 (west): Riddle Hall - Model capabilities")
-            print("  • Room 3 (west): Upgrade Forge - Model management")
-            print("  • Room 4: Victory Chamber (you are here)")
-            print("\nType 'quit' when you're ready to exit.\n")
+            # Closing frame and post-victory exploration hints
+            sys.stdout.write(_VICTORY_FOOTER)
             
             # DO NOT set game_running to False - allow exploration!
             # self.game_running = False  <-- Removed this line
         else:
-            print("\n(Rare case: Even large models can occasionally fail.)")
-            print("Try 'riddle' again!")
+            self._emit("\n(Rare case: Even large models can occasionally fail.)", "Try 'riddle' again!")
     
     def _unlock_victory(self) -> None:
         """Handle password entry to unlock the Victory Chamber."""
-        print("\n🔓 Password accepted!")
-        print("The ancient lock glows brightly and the chamber doors swing open!")
-        print("\nYou step inside the Victory Chamber...")
-        time.sleep(1.5)
+        player = self.player
+        self._emit(
+            "\n🔓 Password accepted!",
+            "The ancient lock glows brightly and the chamber doors swing open!",
+            "\nYou step inside the Victory Chamber...",
+        )
+        pause(1.5)
         print()
         
-        # Award points
-        self.player.add_knowledge_points(100)
-        
-        # Mark complete
-        self.player.complete_objective("room4_complete")
-        self.current_room.mark_completed()
+        # Award points and mark complete
+        player.finalize_room(self.current_room, "room4_complete", points=100)
         
         # Show victory screen
         display_victory()
-        time.sleep(1.0)
+        pause(1.0)
         
-        print("🏆 GROUND LEVEL COMPLETE! 🏆\n")
-        print("You have earned the title: \"Ollama Apprentice\"\n")
-        time.sleep(1.0)
+        self._emit("🏆 GROUND LEVEL COMPLETE! 🏆\n", "You have earned the title: \"Ollama Apprentice\"\n")
+        pause(1.0)
         
         # Display certificate
         display_certificate()
-        time.sleep(1.5)
+        pause(1.5)
         
         # Prompt user to press Enter before showing the path forward
         print()
-        input("Press Enter to continue...")
+        self._read_line("Press Enter to continue...")
         print()
         
-        # Show the path forward
-        print("\n🚪 THE PATH FORWARD 🚪\n")
-        print("Your training is complete, but your adventure has just begun!")
-        print("The dungeon descends deeper with greater challenges awaiting...\n")
-        time.sleep(1.0)
-        
-        print("  ⬇️  NEXT: Token Crypts")
-        print("      Learn how LLMs see the world through tokens.")
-        print("      Run: python3 ./token_crypts_cli.py\n")
-        time.sleep(0.8)
-        
-        print("  🔮 COMING SOON:")
-        print("      • Temperature Tavern - Master sampling parameters")
-        print("      • Context Catacombs - Understand context windows")
-        print("      • Prompt Palace - Advanced prompt engineering\n")
-        time.sleep(0.8)
-        
-        # Real-world next steps
-        print("💡 REAL-WORLD NEXT STEPS:")
-        print("   1. Install Ollama: https://ollama.com/download")
-        print("   2. Pull your first model: ollama pull llama3")
-        print("   3. Start chatting: ollama run llama3")
-        print()
-        print("📚 Learn more about Ollama:")
-        print("   • GitHub repository: https://github.com/ollama/ollama")
-        print("   • API docs: https://github.com/ollama/ollama/blob/main/docs/api.md")
-        print("   • Model library: https://ollama.com/library\n")
-        time.sleep(0.5)
+        # Show the path forward and real-world next steps
+        for text, delay in _PATH_FORWARD_SCRIPT:
+            sys.stdout.write(text)
+            pause(delay)
         
         # Show stats
-        print(f"Final Knowledge Points: {self.player.knowledge_points}")
-        print(f"Tips Unlocked: {len(self.player.unlocked_tips)}/4\n")
+        sys.stdout.write(
+            f"Final Knowledge Points: {player.knowledge_points}\n"
+            f"Tips Unlocked: {len(player.unlocked_tips)}/{len(self.tips)}\n\n"
+        )
         
-        self.player.display_unlocked_tips(self.tips)
+        player.display_unlocked_tips(self.tips)
         
         # Enable exploration and descend option
-        print("\n" + "="*60)
-        print("Type 'descend' to proceed to deeper levels, or 'quit' to exit.")
-        print("You can also explore the dungeon by moving 'west' to revisit rooms.")
-        print("="*60 + "\n")
+        sys.stdout.write(_DESCEND_FOOTER)
     
     def _handle_descend(self) -> None:
         """Handle the descend command to transition to deeper levels."""
@@ -971,7 +1168,9 @@ class GameEngine:
         slow_print("You've mastered the fundamentals of Ollama.")
         slow_print("Now it's time to learn how LLMs truly see the world.\n")
         
-        # Use the shared navigation system
+        # Use the shared navigation system, imported here since only
+        # players who finish the level ever need it
+        from game.navigation import show_descend_menu
         show_descend_menu("Ground Level (Ollama Village)")
     
     def _move_to_room(self, room_id: int) -> None:
@@ -989,7 +1188,7 @@ class GameEngine:
         
         # Move player
         self.player.move_to_room(room_id)
-        self.current_room = create_room(room_id)
+        self.current_room = self._rooms[room_id]
         
         # Show transition
         display_room_transition()
@@ -999,48 +1198,23 @@ class GameEngine:
     
     def _handle_quit(self) -> None:
         """Handle quit command."""
-        print("\nThank you for playing AI-LLM-Dungeon!")
-        print("\n💡 To continue your adventure later:")
-        print("   • Run this level again: python3 ./ground_level_cli.py")
-        print("   • Try other levels: python3 ./token_crypts_cli.py")
-        print("   • Use 'ls' to see all available level scripts")
-        print("\nYour progress has been noted. Farewell, adventurer!\n")
+        sys.stdout.write(_QUIT_TEXT)
         self.game_running = False
+        raise _QuitGame
     
     def _handle_help(self) -> None:
         """Display help information."""
-        level_specific = """LEARNING:
-  learn                    - Begin or continue lessons with the Shaman
-  tips                     - View unlocked knowledge tips
-
-OLLAMA COMMANDS (as you learn them):
-  ollama                   - Base ollama command
-  ollama serve             - Start ollama server
-  ollama list              - List installed models
-  ollama pull <model>      - Download a model
-  ollama run <model>       - Run/chat with a model
-  ollama show <model>      - Show model information
-  ollama rm <model>        - Remove a model
-
-ROOM-SPECIFIC:
-  summon <model>           - Summon sidekick in Summoning Chamber
-  answer <text>            - Answer riddles in Riddle Hall
-  upgrade <sidekick>       - Upgrade sidekick in Upgrade Forge"""
-        
-        tips = """TIPS:
-  - Follow the Shaman's teachings in Ollama Village
-  - Room-specific commands vary - follow the prompts!
-  - Use 'east' or 'west' to move between rooms when available"""
-        
-        print(self.standard_commands.format_help(level_specific, tips))
+        sys.stdout.write(_HELP_TEXT)
     
     def _handle_status(self) -> None:
         """Display player status."""
-        print(self.player.get_status())
+        status = self.player.get_status() + "\n"
+        
+        sidekick = self.player.active_sidekick
+        if sidekick:
+            status += "ACTIVE SIDEKICK:\n" + sidekick.get_status() + "\n"
         
-        if self.player.active_sidekick:
-            print("ACTIVE SIDEKICK:")
-            print(self.player.active_sidekick.get_status())
+        sys.stdout.write(status)
     
     def _handle_tips(self) -> None:
         """Display unlocked tips."""
@@ -1055,76 +1229,26 @@ ROOM-SPECIFIC:
     
     def _handle_ls(self) -> None:
         """List available exits from current room."""
-        room_id = self.player.current_room
-        
-        # Define room connections
-        exits = {}
-        if room_id == 0:
-            if self.player.has_completed_objective("room0_complete"):
-                exits = {"east": "Summoning Chamber"}
-        elif room_id == 1:
-            exits = {"west": "Ollama Village"}
-            if self.player.active_sidekick:
-                exits["east"] = "Riddle Hall"
-        elif room_id == 2:
-            exits = {"west": "Summoning Chamber"}
-            if self.player.has_completed_objective("room2_complete"):
-                exits["east"] = "Upgrade Forge"
-        elif room_id == 3:
-            exits = {"west": "Riddle Hall"}
-            if self.player.has_completed_objective("room3_complete"):
-                exits["east"] = "Victory Chamber"
-        elif room_id == 4:
-            exits = {"west": "Upgrade Forge"}
+        player = self.player
+        completed = player.completed_rooms_mask
+        if player.discovered_password:
+            completed |= _PASSWORD_GATE
+        exits = [
+            f"  {direction} -> {destination}"
+            for direction, destination, mask in _ROOM_EXITS[player.current_room]
+            if completed & mask == mask
+        ]
         
         if not exits:
             print("\nNo exits available from this room yet.\n")
             return
         
-        print("\nAvailable directions:")
-        for direction, destination in exits.items():
-            print(f"  {direction} -> {destination}")
-        print()
+        self._emit("\nAvailable directions:", *exits, "")
     
     def _handle_pwd(self) -> None:
         """Show ASCII map with current position marked."""
-        room_id = self.player.current_room
-        
-        # Map room IDs to display labels
-        room_map = {
-            0: "VILLAGE",
-            1: "SUMMON",
-            2: "RIDDLE",
-            3: "FORGE",
-            4: "VICTORY"
-        }
-        
-        # ASCII map layout
-        map_layout = [
-            "    [VILLAGE]───[SUMMON]───[RIDDLE]───[FORGE]───[VICTORY]"
-        ]
-        
-        # Mark current position
-        print()
-        for line in map_layout:
-            output_line = line
-            for rid, label in room_map.items():
-                if rid == room_id:
-                    output_line = output_line.replace(f"[{label}]", f"[{label}*]")
-            print(output_line)
-        print()
+        sys.stdout.write(_PWD_TEXT[self.player.current_room])
     
     def _handle_map(self) -> None:
         """Display full level map."""
-        print("\n╔══════════════════════════════════════════════════════════════╗")
-        print("║                      OLLAMA VILLAGE MAP                      ║")
-        print("╚══════════════════════════════════════════════════════════════╝")
-        print()
-        print("    [VILLAGE]───[SUMMON]───[RIDDLE]───[FORGE]───[VICTORY]")
-        print()
-        print("  • VILLAGE     - Ollama Village (Learn Ollama basics)")
-        print("  • SUMMON      - Summoning Chamber (Summon your sidekick)")
-        print("  • RIDDLE      - Riddle Hall (Solve riddles with your sidekick)")
-        print("  • FORGE       - Upgrade Forge (Upgrade your sidekick)")
-        print("  • VICTORY     - Victory Chamber (Complete the level)")
-        print()
+        sys.stdout.write(_MAP_TEXT)
@@ -0,0 +1,116 @@
+"""Ollama Village lesson text for the Ground Level of AI-LLM-Dungeon."""
+
+# The Shaman's introduction when the player first types 'learn'
+INSTALL_LESSON = (
+    "\n=== LESSON 1: Installing Ollama ===\n",
+    "The Shaman speaks:\n"
+    "'Before you can wield the power of local LLMs, you must first\n"
+    "install the Ollama tool on your system.'\n"
+    "\n"
+    "'This dungeon is a SIMULATION that teaches you the exact commands\n"
+    "you'll need when you're ready to install Ollama for real.\n"
+    "No installation is required to play this game!'\n"
+    "\n"
+    "For installation instructions when you're ready, visit:\n"
+    "  https://ollama.com/download\n"
+    "\n"
+    "'Once installed and running, all commands inside Ollama begin with \"ollama\".\n"
+    "Ollama gives you command-line access to powerful language models\n"
+    "that run entirely on your own machine.'\n"
+    "\n"
+    "Now, let's practice the command. Type: ollama",
+)
+
+# The Shaman's debrief after each Ollama Village lesson (1-7): a heading
+# paced at 0.5s, then the teaching that leads into the next lesson
+LESSON_DEBRIEFS = (
+    None,
+    (
+        "=== LESSON 2: Starting the Ollama Service ===\n",
+        "The Shaman demonstrates:\n"
+        "'The `ollama serve` command starts the Ollama daemon in the background.\n"
+        "This service listens for requests and manages your LLM models.\n"
+        "On most systems, this starts automatically, but it's good to know!'\n"
+        "\n"
+        "Now, practice this command. Type: ollama serve",
+    ),
+    (
+        "✅ Lesson 2 Complete!\n",
+        "=== LESSON 3: Listing Your Models ===\n"
+        "\n"
+        "The Shaman explains:\n"
+        "'To see which models you have installed, use: ollama list'\n"
+        "'This command will be useful to verify your models after pulling them.'\n"
+        "\n"
+        "Practice this command now. Type: ollama list",
+    ),
+    (
+        "✅ Lesson 3 Complete!\n",
+        "The Shaman nods:\n"
+        "'You haven't pulled any models yet. Let's learn how to do that next!\n"
+        "\n"
+        "=== LESSON 4: Pulling (Downloading) Models ===\n"
+        "\n"
+        "The Shaman teaches the most important command:\n"
+        "'To download a model, use: ollama pull <model-name>'\n"
+        "'Each model has a size - smaller models are faster but less capable.\n"
+        "Phi3 Mini is about 2.3 GB. Larger models like Llama3 are 4-5 GB.\n"
+        "Choose based on your needs and available disk space!'\n"
+        "\n"
+        "Now, let's pull the phi3:mini model. Type: ollama pull phi3:mini",
+    ),
+    (
+        "✅ Lesson 4 Complete!\n",
+        "=== LESSON 5: Running Models ===\n"
+        "\n"
+        "The Shaman demonstrates:\n"
+        "'Once a model is pulled, you can chat with it using: ollama run <model-name>'\n"
+        "\n"
+        "Example:\n"
+        "  $ ollama run phi3:mini\n"
+        "  >>> Tell me about AI\n"
+        "  [The model responds with information about AI...]\n"
+        "  >>> /bye\n"
+        "\n"
+        "'This is how you interact with your local LLM assistants!'\n"
+        "\n"
+        "Practice running the model. Type: ollama run phi3:mini",
+    ),
+    (
+        "✅ Lesson 5 Complete!\n",
+        "=== LESSON 6: Inspecting Model Information ===\n"
+        "\n"
+        "The Shaman demonstrates:\n"
+        "'To see detailed information about a model, use: ollama show <model-name>'\n"
+        "'This displays the model's architecture, parameters, and configuration.\n"
+        "It's useful for understanding what you're working with!'\n"
+        "\n"
+        "Example:\n"
+        "  $ ollama show phi3:mini\n"
+        "  [Shows model architecture, parameters, quantization, etc...]\n"
+        "\n"
+        "Practice inspecting the model. Type: ollama show phi3:mini",
+    ),
+    (
+        "✅ Lesson 6 Complete!\n",
+        "=== LESSON 7: Removing Models ===\n"
+        "\n"
+        "The Shaman explains the final command:\n"
+        "'Models take up disk space. When you no longer need one,\n"
+        "you can remove it with: ollama rm <model-name>'\n"
+        "'This frees up space for other models. You can always pull it again later!\n"
+        "Good model management keeps your system tidy and efficient.'\n"
+        "\n"
+        "Practice removing the model. Type: ollama rm phi3:mini",
+    ),
+    (
+        "✅ Lesson 7 Complete!\n",
+        "The Shaman smiles warmly:\n"
+        "'You have learned all the essential Ollama commands!\n"
+        "You are now ready to face the challenges ahead.'\n"
+        "\n"
+        "🎓 TRAINING COMPLETE! 🎓\n"
+        "You may now proceed east to the Summoning Chamber.\n"
+        "Type 'east' when you are ready.\n",
+    ),
+)
@@ -1,8 +1,58 @@
 """Ollama command simulator for the Ground Level of AI-LLM-Dungeon."""
 
-import time
 import sys
-from typing import Optional, Set
+from typing import Dict, Optional
+from .ascii_art import pacing_enabled, pause
+
+# Reference card shown by display_help
+_OLLAMA_HELP_TEXT = """
+╔═══════════════════════════════════════════════════════════╗
+║                 OLLAMA COMMANDS (Simulated)               ║
+╠═══════════════════════════════════════════════════════════╣
+║                                                           ║
+║  ollama pull <model>   - Download a model                 ║
+║  ollama list           - List installed models            ║
+║  ollama show <model>   - Show model information           ║
+║  ollama run <model>    - Run a model with a prompt        ║
+║  ollama remove <model> - Remove a model                   ║
+║                                                           ║
+║  Examples:                                                ║
+║    ollama pull llama3                                     ║
+║    ollama show llama3                                     ║
+║    ollama remove phi3                                     ║
+║    ollama run llama3 "Tell me a joke"                     ║
+║                                                           ║
+╚═══════════════════════════════════════════════════════════╝
+
+"""
+
+# Download progress bar drawn at every step, built once
+_BAR_STEPS = 20
+_BARS = tuple("█" * filled + "░" * (_BAR_STEPS - filled) for filled in range(_BAR_STEPS + 1))
+
+# Metadata assumed for a model the simulator has no entry for
+_UNKNOWN_MODEL_METADATA = {"id": "abc123def456", "size": "1.5 GB", "size_bytes": 1500}
+
+# Details printed by 'ollama show' for an installed model
+_MODEL_DETAILS = """
+Model
+  architecture      llama
+  parameters        3.8B
+  quantization      Q4_0
+  context length    2048
+  embedding length  3072
+
+Parameters
+  stop  "<|im_start|>"
+  stop  "<|im_end|>"
+
+License
+  MIT License
+
+System
+  You are a helpful assistant.
+
+"""
 
 
 class OllamaSimulator:
@@ -20,11 +70,12 @@ class OllamaSimulator:
     
     def __init__(self):
         """Initialize the Ollama simulator."""
-        self.installed_models: Set[str] = set()
+        self.installed_models: Dict[str, None] = {}  # Insertion-ordered set of pulled models
         self.model_metadata = {
             "phi3-mini": {"id": "a2b3c4d5e6f7", "size": "2.3 GB", "size_bytes": 2300},
             "llama3-8b": {"id": "b3c4d5e6f7a8", "size": "4.7 GB", "size_bytes": 4700}
         }
+        self._list_text: Optional[str] = None  # 'ollama list' output, reset when models change
     
     def pull_model(self, model_name: str) -> bool:
         """
@@ -42,13 +93,14 @@ class OllamaSimulator:
         print(f"Pulling {model_name}...\n")
         
         # Get model size for realistic simulation
-        size_bytes = self.model_metadata.get(model_name, {}).get("size_bytes", 1500)
+        size_bytes = self.model_metadata.get(model_name, _UNKNOWN_MODEL_METADATA)["size_bytes"]
         
         # Simulate download progress
         self._show_progress_bar(model_name, duration=2.0, total_size=size_bytes)
         
         # Add to installed models
-        self.installed_models.add(model_name)
+        self.installed_models[model_name] = None
+        self._list_text = None
         
         print(f"\n✅ Successfully pulled {model_name}")
         print(f"Model is ready to use!\n")
@@ -68,7 +120,8 @@ class OllamaSimulator:
         print(f"\n🗑️  Simulating: ollama remove {model_name}")
         
         if model_name in self.installed_models:
-            self.installed_models.remove(model_name)
+            del self.installed_models[model_name]
+            self._list_text = None
             print(f"✅ Removed {model_name}")
             print(f"Memory has been freed!\n")
             return True
@@ -87,29 +140,33 @@ class OllamaSimulator:
             print("\nNo models installed yet.")
             return []
         
-        print("\n📋 Simulating: ollama list")
-        print("\nNAME            ID              SIZE      MODIFIED")
+        # The table only changes when a model is pulled or removed
+        if self._list_text is None:
+            self._list_text = self._format_model_list()
+        sys.stdout.write(self._list_text)
+        
+        return list(self.installed_models)
+    
+    def _format_model_list(self) -> str:
+        """
+        Format the 'ollama list' table for the installed models.
+        
+        Returns:
+            The full command output, ready to write
+        """
+        lines = ["\n📋 Simulating: ollama list", "\nNAME            ID              SIZE      MODIFIED"]
         
-        import datetime
         for i, model_name in enumerate(sorted(self.installed_models)):
-            metadata = self.model_metadata.get(model_name, {
-                "id": "abc123def456",
-                "size": "1.5 GB"
-            })
+            metadata = self.model_metadata.get(model_name, _UNKNOWN_MODEL_METADATA)
             
             # Simulate different modification times
             minutes_ago = (i + 1) * 2
             modified = f"{minutes_ago} minutes ago" if minutes_ago < 60 else f"{minutes_ago // 60} hours ago"
             
-            # Format the output to align properly
-            name_col = model_name.ljust(16)
-            id_col = metadata["id"].ljust(16)
-            size_col = metadata["size"].ljust(10)
-            
-            print(f"{name_col}{id_col}{size_col}{modified}")
+            # Pad the columns to align under the header
+            lines.append(f"{model_name:<16}{metadata['id']:<16}{metadata['size']:<10}{modified}")
         
-        print()
-        return list(self.installed_models)
+        return "\n".join(lines) + "\n\n"
     
     def show_model(self, model_name: str) -> bool:
         """
@@ -130,29 +187,8 @@ class OllamaSimulator:
             print(f"⚠️  Error: model '{model_name}' not found\n")
             return False
         
-        metadata = self.model_metadata.get(model_name, {
-            "id": "abc123def456",
-            "size": "1.5 GB"
-        })
-        
         # Display detailed model information
-        print(f"\nModel")
-        print(f"  architecture      llama")
-        print(f"  parameters        3.8B")
-        print(f"  quantization      Q4_0")
-        print(f"  context length    2048")
-        print(f"  embedding length  3072")
-        print()
-        print(f"Parameters")
-        print(f"  stop  \"<|im_start|>\"")
-        print(f"  stop  \"<|im_end|>\"")
-        print()
-        print(f"License")
-        print(f"  MIT License")
-        print()
-        print(f"System")
-        print(f"  You are a helpful assistant.")
-        print()
+        sys.stdout.write(_MODEL_DETAILS)
         
         return True
     
@@ -176,7 +212,7 @@ class OllamaSimulator:
         """
         print("\n🔄 Simulating: ollama serve")
         print("\nStarting Ollama server...")
-        time.sleep(0.5)
+        pause(0.5)
         print("Ollama is running on http://localhost:11434")
         print("✅ Server is ready to accept requests\n")
     
@@ -189,22 +225,23 @@ class OllamaSimulator:
             duration: Total duration of the progress bar in seconds
             total_size: Total size in MB
         """
-        total_steps = 20
+        total_steps = _BAR_STEPS
         sleep_time = duration / total_steps
         
-        for i in range(total_steps + 1):
+        # Only a terminal can redraw the bar in place; elsewhere the
+        # intermediate frames would pile up, so just the finished bar is drawn
+        steps = range(total_steps + 1) if pacing_enabled() else (total_steps,)
+        
+        for i in steps:
             percent = (i / total_steps) * 100
-            filled = int(i)
-            bar = "█" * filled + "░" * (total_steps - filled)
             
             # Simulate download size based on total_size
             size_mb = int((i / total_steps) * total_size)
             
-            sys.stdout.write(f"\r[{bar}] {percent:5.1f}% ({size_mb} MB / {total_size} MB)")
-            sys.stdout.flush()
+            sys.stdout.write(f"\r[{_BARS[i]}] {percent:5.1f}% ({size_mb} MB / {total_size} MB)")
             
             if i < total_steps:
-                time.sleep(sleep_time)
+                pause(sleep_time)
         
         print()  # New line after progress bar
     
@@ -229,33 +266,14 @@ class OllamaSimulator:
         print(f"\n🤖 Simulating: ollama run {model_name}")
         print(f"Prompt: {prompt}\n")
         print("⏳ Processing...")
-        time.sleep(1)  # Simulate processing time
+        pause(1)  # Simulate processing time
         print("✅ Model response complete!\n")
         
         return "Response simulated successfully"
     
     def display_help(self) -> None:
         """Display help information about Ollama commands."""
-        help_text = """
-╔═══════════════════════════════════════════════════════════╗
-║                 OLLAMA COMMANDS (Simulated)               ║
-╠═══════════════════════════════════════════════════════════╣
-║                                                           ║
-║  ollama pull <model>   - Download a model                 ║
-║  ollama list           - List installed models            ║
-║  ollama show <model>   - Show model information           ║
-║  ollama run <model>    - Run a model with a prompt        ║
-║  ollama remove <model> - Remove a model                   ║
-║                                                           ║
-║  Examples:                                                ║
-║    ollama pull llama3                                     ║
-║    ollama show llama3                                     ║
-║    ollama remove phi3                                     ║
-║    ollama run llama3 "Tell me a joke"                     ║
-║                                                           ║
-╚═══════════════════════════════════════════════════════════╝
-"""
-        print(help_text)
+        sys.stdout.write(_OLLAMA_HELP_TEXT)
     
     def __str__(self) -> str:
         """String representation of the simulator state."""
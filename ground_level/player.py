@@ -1,7 +1,31 @@
 """Player class for the Ground Level of AI-LLM-Dungeon."""
 
-from typing import Optional, Set
+from typing import TYPE_CHECKING, Optional, Set
 from .sidekick import Sidekick
+from .ascii_art import display_tip_unlock
+
+if TYPE_CHECKING:
+    from .room import Room
+
+# Bit recorded in Player.completed_rooms_mask for each room-completion objective
+_ROOM_COMPLETE_BITS = {f"room{room_id}_complete": 1 << room_id for room_id in range(5)}
+
+# Rooms that require an earlier room: room ID -> (completed_rooms_mask bit
+# of the prerequisite room, reason shown when it is not yet complete)
+_ROOM_GATES = {
+    1: (1 << 0, "You must complete the Ollama Village training first!"),
+    2: (1 << 1, "You must complete the Summoning Chamber first!"),
+    3: (1 << 2, "You must complete the Riddle Hall first!"),
+    4: (1 << 3, "You must complete the Upgrade Forge first!"),
+}
+
+# Objectives that each advance Player.next_lesson_index by one
+_LESSON_OBJECTIVES = frozenset(
+    ("room0_lesson1_taught", *(f"room0_lesson{lesson}" for lesson in range(1, 8)))
+)
+
+# Horizontal rule framing the status panel
+_STATUS_RULE = "=" * 50
 
 
 class Player:
@@ -17,8 +41,17 @@ class Player:
         knowledge_points (int): Points earned by completing objectives
         unlocked_tips (Set[str]): Set of tip IDs that have been unlocked
         completed_objectives (Set[str]): Set of completed objective IDs
+        next_lesson_index (int): Index of the next Ollama Village lesson
+            (0 = training not started yet)
+        completed_rooms_mask (int): Bitfield of completed rooms (bit N = room N)
     """
     
+    __slots__ = (
+        "current_room", "active_sidekick", "knowledge_points", "unlocked_tips",
+        "completed_objectives", "discovered_password", "next_lesson_index",
+        "completed_rooms_mask",
+    )
+    
     def __init__(self):
         """Initialize a new Player with default values."""
         self.current_room: int = 0  # Start in Room 0 (Ollama Village)
@@ -27,6 +60,8 @@ class Player:
         self.unlocked_tips: Set[str] = set()
         self.completed_objectives: Set[str] = set()
         self.discovered_password: bool = False  # Track if player discovered victory password
+        self.next_lesson_index: int = 0  # Village lessons complete strictly in order
+        self.completed_rooms_mask: int = 0
     
     def move_to_room(self, room_id: int) -> None:
         """
@@ -90,7 +125,6 @@ class Player:
         self.unlocked_tips.add(tip_id)
         
         # Display unlock notification
-        from .ascii_art import display_tip_unlock
         display_tip_unlock(tip_text)
         
         return True
@@ -103,6 +137,35 @@ class Player:
             objective_id: Unique identifier for the objective
         """
         self.completed_objectives.add(objective_id)
+        self.completed_rooms_mask |= _ROOM_COMPLETE_BITS.get(objective_id, 0)
+    
+    def finalize_room(self, room: "Room", objective_id: str, points: int = 0) -> None:
+        """
+        Record a room's completion objective, optionally award points,
+        and mark the room itself as completed in one state update.
+        
+        Args:
+            room: The room being completed
+            objective_id: Unique identifier for the room's completion objective
+            points: Number of knowledge points to award (0 for none)
+        """
+        if points:
+            self.add_knowledge_points(points)
+        self.complete_objective(objective_id)
+        room.mark_completed()
+    
+    def complete_lesson(self, objective_id: str) -> None:
+        """
+        Mark the current Ollama Village lesson as completed.
+        
+        Lessons are taught strictly in order, so completing one simply
+        advances the lesson counter.
+        
+        Args:
+            objective_id: Unique identifier for the lesson objective
+        """
+        self.completed_objectives.add(objective_id)
+        self.next_lesson_index += 1
     
     def has_completed_objective(self, objective_id: str) -> bool:
         """
@@ -136,9 +199,9 @@ class Player:
         Returns:
             A formatted status string showing player progress
         """
-        status = f"\n{'='*50}\n"
+        status = f"\n{_STATUS_RULE}\n"
         status += f"PLAYER STATUS\n"
-        status += f"{'='*50}\n"
+        status += f"{_STATUS_RULE}\n"
         status += f"Current Room: {self.current_room}\n"
         status += f"Knowledge Points: {self.knowledge_points}\n"
         status += f"Tips Unlocked: {len(self.unlocked_tips)}\n"
@@ -148,7 +211,7 @@ class Player:
         else:
             status += f"Active Sidekick: None\n"
         
-        status += f"{'='*50}\n"
+        status += f"{_STATUS_RULE}\n"
         
         return status
     
@@ -180,21 +243,10 @@ class Player:
         Returns:
             Tuple of (can_proceed: bool, reason: str)
         """
-        # Room 1 requires completing room 0 objectives
-        if room_id == 1 and not self.has_completed_objective("room0_complete"):
-            return False, "You must complete the Ollama Village training first!"
-        
-        # Room 2 requires completing room 1 objectives
-        if room_id == 2 and not self.has_completed_objective("room1_complete"):
-            return False, "You must complete the Summoning Chamber first!"
-        
-        # Room 3 requires completing room 2 objectives
-        if room_id == 3 and not self.has_completed_objective("room2_complete"):
-            return False, "You must complete the Riddle Hall first!"
-        
-        # Room 4 requires completing room 3 objectives
-        if room_id == 4 and not self.has_completed_objective("room3_complete"):
-            return False, "You must complete the Upgrade Forge first!"
+        # Each room requires completing the one before it
+        gate = _ROOM_GATES.get(room_id)
+        if gate is not None and not self.completed_rooms_mask & gate[0]:
+            return False, gate[1]
         
         return True, ""
     
@@ -210,6 +262,7 @@ class Player:
             "knowledge_points": self.knowledge_points,
             "unlocked_tips": list(self.unlocked_tips),
             "completed_objectives": list(self.completed_objectives),
+            "next_lesson_index": self.next_lesson_index,
             "active_sidekick_name": self.active_sidekick.name if self.active_sidekick else None
         }
     
@@ -225,6 +278,13 @@ class Player:
         self.knowledge_points = state.get("knowledge_points", 0)
         self.unlocked_tips = set(state.get("unlocked_tips", []))
         self.completed_objectives = set(state.get("completed_objectives", []))
+        self.next_lesson_index = state.get("next_lesson_index")
+        if self.next_lesson_index is None:
+            # Saves made before the counter existed: each recorded lesson advanced it once
+            self.next_lesson_index = len(_LESSON_OBJECTIVES & self.completed_objectives)
+        self.completed_rooms_mask = 0
+        for objective_id in self.completed_objectives:
+            self.completed_rooms_mask |= _ROOM_COMPLETE_BITS.get(objective_id, 0)
         
         # Restore active sidekick
         sidekick_name = state.get("active_sidekick_name")
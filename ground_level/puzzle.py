@@ -15,6 +15,8 @@ class Puzzle:
         solved (bool): Whether the puzzle has been solved
     """
     
+    __slots__ = ("id", "prompt", "solution", "attempts", "solved")
+    
     def __init__(self, id: str, prompt: str, solution: str):
         """
         Initialize a new Puzzle.
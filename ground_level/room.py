@@ -5,6 +5,9 @@ from .sidekick import Sidekick
 from .puzzle import Puzzle
 from .player import Player
 
+# Horizontal rule framing the room title
+_RULE = "=" * 60
+
 
 class Room:
     """
@@ -22,6 +25,11 @@ class Room:
         available_directions (List[str]): Directions the player can move
     """
     
+    __slots__ = (
+        "room_id", "name", "description", "objectives", "completed",
+        "available_directions", "first_visit",
+    )
+    
     def __init__(
         self,
         room_id: int,
@@ -55,9 +63,9 @@ class Room:
         Args:
             player: The player entering the room
         """
-        print(f"\n{'='*60}")
+        print(f"\n{_RULE}")
         print(f"  {self.name} (Room {self.room_id})")
-        print(f"{'='*60}\n")
+        print(f"{_RULE}\n")
         
         if self.first_visit:
             print(self.description)
@@ -104,6 +112,8 @@ class OllamaVillage(Room):
     before they enter the dungeon proper.
     """
     
+    __slots__ = ("lessons_completed", "total_lessons")
+    
     def __init__(self):
         description = """
 You find yourself in a peaceful village nestled at the base of a great mountain.
@@ -143,6 +153,8 @@ class SummoningChamber(Room):
     using the exact scroll text.
     """
     
+    __slots__ = ()
+    
     def __init__(self):
         description = """
 You enter the mystical Summoning Chamber, the first true test of your training.
@@ -175,6 +187,8 @@ class RiddleHall(Room):
     demonstrating small model limitations.
     """
     
+    __slots__ = ()
+    
     def __init__(self):
         description = """
 You enter a grand hall with crystalline walls that shimmer with data streams.
@@ -209,6 +223,8 @@ class UpgradeForge(Room):
     Teaches model management: removing Phi3 Mini and summoning Llama3 8b.
     """
     
+    __slots__ = ()
+    
     def __init__(self):
         description = """
 You discover an ancient forge where models are crafted and refined.
@@ -245,6 +261,8 @@ class VictoryChamber(Room):
     Serves as a transition point to deeper dungeon levels.
     """
     
+    __slots__ = ()
+    
     def __init__(self):
         description = """
 You stand before the sealed Victory Chamber. An ancient lock bars your way,
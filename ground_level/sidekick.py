@@ -1,10 +1,9 @@
 """Sidekick class for the Ground Level of AI-LLM-Dungeon."""
 
 import random
-import time
 from typing import Optional
 from .puzzle import Puzzle
-from .ascii_art import get_sidekick_art
+from .ascii_art import get_sidekick_art, pause
 
 # Message constants for response generation
 _THINKING_MESSAGE = "thinks carefully..."
@@ -25,6 +24,11 @@ class Sidekick:
         active (bool): Whether this sidekick is currently summoned
     """
     
+    __slots__ = (
+        "name", "specialty", "summon_scroll", "memory", "ollama_command",
+        "active", "_success_rate",
+    )
+    
     def __init__(self, name: str, specialty: str, summon_scroll: str, memory: int, ollama_command: str = ""):
         """
         Initialize a new Sidekick.
@@ -42,6 +46,9 @@ class Sidekick:
         self.memory: int = memory
         self.ollama_command: str = ollama_command
         self.active: bool = False
+        
+        # Memory never changes, so the success probability is fixed per model
+        self._success_rate: float = self._success_rate_for(memory)
     
     def summon(self) -> str:
         """
@@ -74,6 +81,24 @@ class Sidekick:
         message += f"Memory freed: {self.memory} GB\n"
         return message
     
+    @staticmethod
+    def _success_rate_for(memory: int) -> float:
+        """
+        Get the riddle success probability for a model of the given size.
+        
+        Args:
+            memory: Memory size in GB
+            
+        Returns:
+            Probability between 0 and 1 that an attempt succeeds
+        """
+        if memory <= 2:
+            return 0.20  # Phi3 Mini struggles with counting
+        elif memory <= 5:
+            return 0.50  # Qwen Lite is better but not perfect
+        else:
+            return 0.95  # Llama3 8b is highly capable
+    
     def _calculate_success(self) -> bool:
         """
         Calculate whether this sidekick succeeds based on memory size.
@@ -81,16 +106,8 @@ class Sidekick:
         Returns:
             True if the attempt succeeds, False otherwise
         """
-        # Calculate success probability based on memory size
-        if self.memory <= 2:
-            success_rate = 0.20  # Phi3 Mini struggles with counting
-        elif self.memory <= 5:
-            success_rate = 0.50  # Qwen Lite is better but not perfect
-        else:
-            success_rate = 0.95  # Llama3 8b is highly capable
-        
         # Simulate the LLM's attempt
-        return random.random() < success_rate
+        return random.random() < self._success_rate
     
     def attempt_riddle(self, puzzle: Puzzle) -> tuple[bool, str]:
         """
@@ -173,18 +190,18 @@ class Sidekick:
         if print_with_delay:
             # Interactive mode with delays
             print(f"\n{self.name} {_THINKING_MESSAGE}")
-            time.sleep(1.5)
+            pause(1.5)
             print(f"🤔 Analyzing: '{puzzle.prompt}'\n")
-            time.sleep(1.0)
+            pause(1.0)
             
             # For the strawberry riddle
             if "strawberry" in puzzle.prompt.lower():
                 print(f"Let me count each letter carefully:")
-                time.sleep(1.0)
+                pause(1.0)
                 print(f"s-t-r-a-w-b-e-r-r-y")
-                time.sleep(1.5)
+                pause(1.5)
                 print(f"I can see the 'r's appearing at positions 3, 8, and 9.\n")
-                time.sleep(1.0)
+                pause(1.0)
             
             print(f"✅ {self.name}: \"The answer is {puzzle.solution}!\"\n")
             return ""  # Already printed
@@ -217,9 +234,9 @@ class Sidekick:
         if print_with_delay:
             # Interactive mode with delays
             print(f"\n{self.name} {_THINKING_MESSAGE}")
-            time.sleep(1.5)
+            pause(1.5)
             print(f"🤔 Analyzing: '{puzzle.prompt}'\n")
-            time.sleep(1.0)
+            pause(1.0)
             
             # For the strawberry riddle, generate plausible wrong answers
             if "strawberry" in puzzle.prompt.lower():
@@ -227,11 +244,11 @@ class Sidekick:
                 wrong_answer = random.choice(wrong_answers)
                 
                 print(f"Hmm, let me count... s-t-r-a-w-b-e-r-r-y...")
-                time.sleep(1.5)
+                pause(1.5)
                 print(f"❌ {self.name}: \"I think the answer is {wrong_answer}.\"\n")
-                time.sleep(1.0)
+                pause(1.0)
                 print(f"💭 {self.name} seems uncertain and made an error.")
-                time.sleep(0.5)
+                pause(0.5)
                 print(f"(Model limitation: {self.name} with {self.memory} GB memory struggles with this task)\n")
             else:
                 print(f"❌ {self.name}: \"I'm not sure... this is difficult for me.\"\n")
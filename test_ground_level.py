@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Tests for the Ground Level game engine.
+
+This script tests command dispatch and player progression for the
+Ground Level without running the interactive game loop.
+"""
+
+import sys
+import os
+import io
+import traceback
+from contextlib import redirect_stdout
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Skip the sidekicks' thinking pauses; the tests only check what is printed
+os.environ.setdefault("GAME_FAST_MODE", "1")
+
+from ground_level.game_engine import GameEngine, _QuitGame, _RIDDLE_TRIGGER_RE
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+
+def run_command(engine: GameEngine, command: str) -> str:
+    """Run a single command and return everything it printed."""
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        engine.process_command(command)
+    return buffer.getvalue()
+
+
+def test_data_loading():
+    """Test that the JSON data files load into the engine registries."""
+    print("Testing data loading...")
+
+    engine = GameEngine(data_dir=DATA_DIR)
+    assert "Phi3 Mini" in engine.sidekicks
+    assert "Llama3 8b" in engine.sidekicks
+    assert "riddle_01" in engine.puzzles
+    assert len(engine.tips) == 4
+    print("  ✓ Sidekicks, puzzles and tips loaded")
+
+    try:
+        engine.tips["tip_99"] = {}
+        assert False, "Registries should be read-only"
+    except TypeError:
+        pass
+    print("  ✓ Registries are read-only")
+
+    print("  Data loading tests passed!\n")
+
+
+def test_command_dispatch():
+    """Test that room and global commands reach the right handlers."""
+    print("Testing command dispatch...")
+
+    engine = GameEngine(data_dir=DATA_DIR)
+
+    # Global commands work in the starting room
+    assert "PLAYER STATUS" in run_command(engine, "status")
+    assert "COMMAND HELP" in run_command(engine, "  HELP ")
+    assert "[VILLAGE*]" in run_command(engine, "pwd")
+    assert "No tips unlocked yet" in run_command(engine, "tips")
+    print("  ✓ Global commands dispatch")
+
+    # Room commands take priority and unknown input gets a room hint
+    output = run_command(engine, "east")
+    assert "The Shaman blocks your path" in output
+    output = run_command(engine, "dance")
+    assert "Unknown command" in output
+    assert "learn" in output
+    print("  ✓ Room commands and unknown-command hints dispatch")
+
+    # Follow-up hints can be silenced for headless runs
+    engine.verbose = False
+    output = run_command(engine, "dance")
+    assert "Unknown command" in output
+    assert "Hint" not in output
+    engine.verbose = True
+    print("  ✓ Hints are skipped when verbose is off")
+
+    # No room may shadow a global command
+    global_commands = engine._commands.keys()
+    for room_id, commands in enumerate(engine._room_commands):
+        assert not commands.keys() & global_commands, f"Room {room_id} shadows a global command"
+    print("  ✓ Room commands do not shadow global commands")
+
+    # Tab completion offers the current room's commands and the global ones
+    assert engine._complete_command("ollama p", 0) == "ollama pull phi3:mini"
+    assert engine._complete_command("ollama p", 1) is None
+    assert engine._complete_command("HE", 0) == "help"
+    print("  ✓ Commands complete from the current room")
+
+    # Quit stops the game loop
+    try:
+        run_command(engine, "quit")
+        assert False, "Quit should leave the game loop"
+    except _QuitGame:
+        pass
+    assert not engine.game_running
+    print("  ✓ Quit stops the game")
+
+    print("  Command dispatch tests passed!\n")
+
+
+def test_village_lesson_gates():
+    """Test that Ollama Village lessons must be completed in order."""
+    print("Testing Ollama Village lesson gates...")
+
+    engine = GameEngine(data_dir=DATA_DIR)
+    assert engine.player.next_lesson_index == 0
+
+    assert "type 'learn' first" in run_command(engine, "ollama")
+    assert "complete the previous lessons" in run_command(engine, "ollama serve")
+    assert "complete the previous lessons" in run_command(engine, "ollama rm phi3:mini")
+    assert engine.player.next_lesson_index == 0
+    print("  ✓ Lessons are locked until training begins")
+
+    # Once a lesson is learned, its command becomes a repeatable practice command
+    engine.player.complete_lesson("room0_lesson1_taught")
+    engine.player.complete_lesson("room0_lesson1")
+    assert engine.player.next_lesson_index == 2
+    assert engine.player.has_completed_objective("room0_lesson1")
+    assert "already learned" in run_command(engine, "ollama")
+    assert "complete the previous lessons" in run_command(engine, "ollama list")
+    print("  ✓ Lesson counter gates later lessons")
+
+    # Saves made before the lesson counter existed resume at the right lesson
+    state = engine.player.save_state()
+    del state["next_lesson_index"]
+    engine.player.load_state(state, engine.sidekicks)
+    assert engine.player.next_lesson_index == 2
+    print("  ✓ Older saves derive the lesson counter from their objectives")
+
+    print("  Ollama Village lesson gate tests passed!\n")
+
+
+def test_room_navigation():
+    """Test moving between rooms once their gates are open."""
+    print("Testing room navigation...")
+
+    engine = GameEngine(data_dir=DATA_DIR)
+    village = engine.current_room
+
+    engine.player.finalize_room(village, "room0_complete")
+    assert engine.player.completed_rooms_mask == 0b1
+    assert village.completed
+    assert "Summoning Chamber" in run_command(engine, "east")
+    assert engine.player.current_room == 1
+    print("  ✓ Completing the village opens the way east")
+
+    output = run_command(engine, "ls")
+    assert "west -> Ollama Village" in output
+    assert "Riddle Hall" not in output
+    assert "Riddle Hall" not in run_command(engine, "east")
+    assert engine.player.current_room == 1
+    print("  ✓ Unfinished rooms block the way east")
+
+    # The Upgrade Forge's east exit also needs the Victory Chamber password
+    engine.player.current_room = 3
+    engine.player.complete_objective("room3_complete")
+    assert "Victory Chamber" not in run_command(engine, "ls")
+    engine.player.discover_password()
+    assert "east -> Victory Chamber" in run_command(engine, "ls")
+    engine.player.current_room = 1
+    print("  ✓ The Victory Chamber is listed only once its password is known")
+
+    run_command(engine, "west")
+    assert engine.player.current_room == 0
+    assert engine.current_room is village
+    assert "You've returned to this room." in run_command(engine, "east")
+    print("  ✓ Revisited rooms are reused")
+
+    print("  Room navigation tests passed!\n")
+
+
+def test_riddle_session():
+    """Test which questions a sidekick session treats as the riddle."""
+    print("Testing riddle sessions...")
+
+    engine = GameEngine(data_dir=DATA_DIR)
+    engine.player.set_active_sidekick(engine.sidekicks["Phi3 Mini"])
+    engine.player.current_room = 2
+    engine.current_room = engine._rooms[2]
+
+    engine._stdin = io.StringIO("tell me a story\n")
+    output = run_command(engine, "ollama run phi3:mini")
+    assert "That's an interesting question" in output
+    assert not engine.player.has_completed_objective("room2_complete")
+    print("  ✓ Questions that merely contain an 'r' are not the riddle")
+
+    engine._stdin = io.StringIO("/bye\n")
+    output = run_command(engine, "ollama run phi3:mini")
+    assert "Exiting interactive session." in output
+    assert "interesting question" not in output
+    print("  ✓ /bye leaves the session")
+
+    # The riddle typed exactly as Riddle Hall shows it is accepted
+    engine._stdin = io.StringIO(engine.puzzles["riddle_01"].prompt + "\n")
+    output = run_command(engine, "ollama run phi3:mini")
+    assert "interesting question" not in output
+    assert engine.player.has_completed_objective("room2_complete")
+    print("  ✓ The puzzle's own prompt is treated as the riddle")
+
+    # Trigger words count only as whole words, possessives and quotes included
+    assert _RIDDLE_TRIGGER_RE.search(engine.puzzles["riddle_01"].prompt.lower())
+    assert _RIDDLE_TRIGGER_RE.search("how many r's are in strawberry?")
+    assert _RIDDLE_TRIGGER_RE.search("what's in strawberry's spelling")
+    assert not _RIDDLE_TRIGGER_RE.search("i like strawberries")
+    print("  ✓ Riddle trigger words match whole words")
+
+    print("  Riddle session tests passed!\n")
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("=" * 60)
+    print("Ground Level Engine Validation")
+    print("=" * 60 + "\n")
+
+    try:
+        test_data_loading()
+        test_command_dispatch()
+        test_village_lesson_gates()
+        test_room_navigation()
+        test_riddle_session()
+
+        print("=" * 60)
+        print("✓ All tests passed successfully!")
+        print("=" * 60)
+        return 0
+
+    except AssertionError as e:
+        print(f"\n✗ Test failed: {e}")
+        traceback.print_exc()
+        return 1
+    except Exception as e:
+        print(f"\n✗ Unexpected error: {e}")
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())